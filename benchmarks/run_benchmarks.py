@@ -0,0 +1,474 @@
+"""
+Benchmark Runner for Roster Lookups and Real Estate Ingest
+
+This script measures the performance of both projects against a throwaway
+PostgreSQL cluster and writes the results as JSON, so runs can be compared
+across releases to catch regressions.
+
+The cluster is created with initdb in a temporary directory, started with
+pg_ctl on a Unix socket only, and removed afterwards. The environment
+variables read by db.py, class_roster_basic.py and real_estate_import.py are
+pointed at it before those modules are imported.
+
+Measurements:
+- DB.main() latency percentiles (p50/p95/p99) on a seeded roster
+- Lookups per second with N threads sharing the connection pool
+- Rows per second for each real_estate_import load method, on a CSV of the
+  requested size generated from data/data.csv by generate_csv.py
+
+Dependencies:
+- PostgreSQL server binaries (initdb, pg_ctl) on PATH or given by --pg-bin
+- psycopg2, python-dotenv, python-dateutil (as for the projects)
+
+Usage:
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --students 100000 --rows 100000 --methods copy,binary
+    python benchmarks/run_benchmarks.py --only roster --threads 16
+"""
+
+import argparse
+import glob
+import json
+import os
+import platform
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+# Repository layout: the projects are plain script directories, not packages
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROSTER_DIR = os.path.join(REPO_ROOT, "class-roster-database")
+REAL_ESTATE_DIR = os.path.join(REPO_ROOT, "real-estate-data-analysis")
+SAMPLE_CSV = os.path.join(REPO_ROOT, "data", "data.csv")
+
+# Role created by initdb; trust authentication needs no password
+BENCH_USER = "bench"
+ROSTER_DBNAME = "class_roster_bench"
+REAL_ESTATE_DBNAME = "real_estate_bench"
+# Seed of the synthetic roster, the names looked up and the generated CSV
+ROSTER_SEED = "bench"
+
+
+def find_pg_bin(pg_bin=None):
+    """
+    Locate the directory holding initdb and pg_ctl.
+
+    Args:
+        pg_bin (str or None): Directory given on the command line
+
+    Returns:
+        str: Directory containing the PostgreSQL server binaries
+
+    Raises:
+        SystemExit: If the binaries cannot be found
+    """
+    candidates = [pg_bin] if pg_bin else []
+    initdb = shutil.which("initdb")
+    if initdb:
+        candidates.append(os.path.dirname(initdb))
+    pg_config = shutil.which("pg_config")
+    if pg_config:
+        bindir = subprocess.run(
+            [pg_config, "--bindir"], capture_output=True, text=True, check=False
+        ).stdout.strip()
+        candidates.append(bindir)
+    # Debian/Ubuntu keep the server binaries out of PATH
+    candidates.extend(sorted(glob.glob("/usr/lib/postgresql/*/bin"), reverse=True))
+    for candidate in candidates:
+        if candidate and os.path.exists(os.path.join(candidate, "initdb")):
+            return candidate
+    raise SystemExit("initdb not found; install PostgreSQL or pass --pg-bin")
+
+
+def free_port():
+    """
+    Pick a TCP port number that is currently unused.
+
+    The server only listens on a Unix socket, whose file name includes the
+    port, but a free number avoids clashing with a local server's socket.
+
+    Returns:
+        int: Port number
+    """
+    with socket.socket() as probe:
+        probe.bind(("localhost", 0))
+        return probe.getsockname()[1]
+
+
+class ThrowawayCluster:
+    """
+    PostgreSQL cluster living in a temporary directory for one benchmark run.
+    """
+
+    def __init__(self, pg_bin, keep=False):
+        """
+        Args:
+            pg_bin (str): Directory containing initdb and pg_ctl
+            keep (bool): Leave the directory in place after stopping
+        """
+        self.pg_bin = pg_bin
+        self.keep = keep
+        self.root = tempfile.mkdtemp(prefix="psycopg2-bench-")
+        self.data_dir = os.path.join(self.root, "data")
+        self.socket_dir = self.root  # Unix socket directory, used as host
+        self.port = free_port()
+
+    def run(self, program, *args):
+        """
+        Run a PostgreSQL binary, raising with its output if it fails.
+        """
+        command = [os.path.join(self.pg_bin, program), *args]
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"{program} failed:\n{result.stdout}{result.stderr}")
+
+    def start(self):
+        """
+        Create the cluster and start the server.
+        """
+        self.run(
+            "initdb",
+            "-D",
+            self.data_dir,
+            "-U",
+            BENCH_USER,
+            "-A",
+            "trust",
+            "-E",
+            "UTF8",
+            "--no-sync",
+        )
+        options = f"-p {self.port} -k {self.socket_dir} -c listen_addresses=''"
+        self.run(
+            "pg_ctl",
+            "-D",
+            self.data_dir,
+            "-l",
+            os.path.join(self.root, "server.log"),
+            "-o",
+            options,
+            "-w",
+            "start",
+        )
+
+    def stop(self):
+        """
+        Stop the server and remove the cluster unless it should be kept.
+        """
+        try:
+            self.run("pg_ctl", "-D", self.data_dir, "-m", "fast", "-w", "stop")
+        finally:
+            if not self.keep:
+                shutil.rmtree(self.root, ignore_errors=True)
+
+    def create_databases(self, *names):
+        """
+        Create empty databases owned by the benchmark role.
+        """
+        import psycopg2
+
+        conn = psycopg2.connect(
+            dbname="postgres", user=BENCH_USER, host=self.socket_dir, port=self.port
+        )
+        try:
+            # CREATE DATABASE cannot run inside a transaction
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                for name in names:
+                    cur.execute(f"CREATE DATABASE {name}")
+            return conn.server_version
+        finally:
+            conn.close()
+
+    def configure_environment(self, threads, cache):
+        """
+        Point the projects' environment variables at this cluster.
+
+        Must run before the project modules are imported, since they read
+        their configuration at import time (load_dotenv() does not override
+        variables that are already set).
+
+        Args:
+            threads (int): Lookup threads, used to size the connection pool
+            cache (bool): Keep the lookup cache on (off measures the database)
+        """
+        os.environ.update(
+            {
+                "CLASS_ROASTER_DBNAME": ROSTER_DBNAME,
+                "CLASS_ROASTER_HOST": self.socket_dir,
+                "CLASS_ROASTER_USER": BENCH_USER,
+                "CLASS_ROASTER_PASSWORD": "",
+                "CLASS_ROASTER_PORT": str(self.port),
+                # Keep every pooled connection open, so the lookups/sec
+                # figures do not include reconnects
+                "CLASS_ROASTER_POOL_MINCONN": str(max(threads, 1)),
+                "CLASS_ROASTER_POOL_MAXCONN": str(max(threads, 1)),
+                "CLASS_ROASTER_CACHE_SIZE": "1024" if cache else "0",
+                "CLASS_ROASTER_CACHE_LISTEN": "0",
+                "REAL_ESTATE_DBNAME": REAL_ESTATE_DBNAME,
+                "REAL_ESTATE_USER": BENCH_USER,
+                "REAL_ESTATE_PASSWORD": "",
+                "REAL_ESTATE_PORT": str(self.port),
+                # libpq defaults, used when no host is configured (the real
+                # estate scripts read theirs from HREAL_ESTATE_HOST)
+                "PGHOST": self.socket_dir,
+                "PGPORT": str(self.port),
+            }
+        )
+        for project_dir in (ROSTER_DIR, REAL_ESTATE_DIR):
+            if project_dir not in sys.path:
+                sys.path.insert(0, project_dir)
+
+
+def percentiles(samples):
+    """
+    Summarize latency samples in milliseconds.
+
+    Args:
+        samples (list): Durations in seconds (at least two)
+
+    Returns:
+        dict: p50, p95, p99, mean and max in milliseconds
+    """
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50_ms": cuts[49] * 1000,
+        "p95_ms": cuts[94] * 1000,
+        "p99_ms": cuts[98] * 1000,
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "max_ms": max(samples) * 1000,
+    }
+
+
+def lookup_names(count):
+    """
+    Names to look up, drawn from the same distribution as the seeded roster.
+
+    Args:
+        count (int): Number of names
+
+    Returns:
+        list: Student names (popular names repeat, as in real traffic)
+    """
+    from class_roster_basic import synthetic_students
+
+    # A shard the roster itself never uses, so the draws are independent
+    return [
+        name
+        for chunk in synthetic_students(count, ROSTER_SEED, shard=-1)
+        for name, _ in chunk
+    ]
+
+
+def bench_roster(students, lookups, threads, seed_workers):
+    """
+    Seed the roster and measure lookup latency and throughput.
+
+    Args:
+        students (int): Synthetic students to seed
+        lookups (int): Lookups per measurement
+        threads (int): Threads used for the throughput measurement
+        seed_workers (int): Worker processes used for seeding
+
+    Returns:
+        dict: Roster benchmark results
+    """
+    import class_roster_basic
+    from db import DB, close_pool
+
+    started = time.perf_counter()
+    class_roster_basic.main(
+        [
+            "--seed-students",
+            str(students),
+            "--seed",
+            ROSTER_SEED,
+            "--workers",
+            str(seed_workers),
+        ]
+    )
+    seed_seconds = time.perf_counter() - started
+
+    # class_roster_basic.main() reports errors instead of raising them
+    conn = class_roster_basic.connect()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT count(*) FROM students")
+            (roster_size,) = cur.fetchone()
+    finally:
+        conn.close()
+    if roster_size < students:
+        raise RuntimeError(f"Seeding failed: {roster_size} of {students} students")
+
+    names = lookup_names(lookups)
+    db = DB()
+    # Warm up: open the pooled connection and PREPARE the lookup
+    for name in names[:100]:
+        db.main(name)
+
+    latencies = []
+    for name in names:
+        started = time.perf_counter()
+        db.main(name)
+        latencies.append(time.perf_counter() - started)
+
+    def lookup_all(share):
+        # DB keeps the borrowed connection on the instance, so one per thread
+        thread_db = DB()
+        for name in share:
+            thread_db.main(name)
+
+    shares = [names[i::threads] for i in range(threads)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lookup_all, shares))
+    throughput_seconds = time.perf_counter() - started
+    close_pool()
+
+    return {
+        "students": roster_size,
+        "seed_seconds": seed_seconds,
+        "seed_rows_per_second": students / seed_seconds if seed_seconds else None,
+        "lookup_latency": {"lookups": len(latencies), **percentiles(latencies)},
+        "lookup_throughput": {
+            "threads": threads,
+            "lookups": len(names),
+            "seconds": throughput_seconds,
+            "lookups_per_second": len(names) / throughput_seconds,
+        },
+    }
+
+
+def bench_import(csv_path, rows, methods, workers):
+    """
+    Measure rows per second for each load method of real_estate_import.
+
+    Args:
+        csv_path (str): Path of the generated CSV file to create
+        rows (int): Number of data rows to import
+        methods (list): Load methods to measure
+        workers (int): Also measure import_parallel() with this many workers
+                       if greater than 1
+
+    Returns:
+        dict: Import benchmark results per method
+    """
+    import real_estate_import
+    from generate_csv import generate_csv
+
+    with open(csv_path, "w", newline="", encoding="utf-8") as output:
+        rows = generate_csv(output, rows, SAMPLE_CSV, seed=ROSTER_SEED)
+    runs = [(method, method, 1) for method in methods]
+    if workers > 1:
+        runs.append((f"parallel-{methods[0]}-x{workers}", methods[0], workers))
+
+    results = {}
+    for label, method, run_workers in runs:
+        conn = real_estate_import.connect()
+        try:
+            started = time.perf_counter()
+            if run_workers > 1:
+                real_estate_import.import_parallel(conn, csv_path, run_workers, method)
+            else:
+                real_estate_import.import_csv(conn, csv_path, method)
+            seconds = time.perf_counter() - started
+        finally:
+            conn.close()
+        results[label] = {"seconds": seconds, "rows_per_second": rows / seconds}
+        print(f"import {label}: {rows / seconds:,.0f} rows/s")
+    return {"rows": rows, "methods": results}
+
+
+def parse_args(argv=None):
+    """
+    Parse command-line options.
+
+    Args:
+        argv (list or None): Arguments to parse, defaults to sys.argv
+
+    Returns:
+        argparse.Namespace: Parsed options
+    """
+    arg_parser = argparse.ArgumentParser(
+        description="Benchmark roster lookups and real estate imports."
+    )
+    arg_parser.add_argument("--output", default="benchmark_results.json")
+    arg_parser.add_argument(
+        "--only", choices=("roster", "import"), help="Run a single benchmark"
+    )
+    arg_parser.add_argument("--students", type=int, default=1_000_000)
+    arg_parser.add_argument("--seed-workers", type=int, default=os.cpu_count() or 1)
+    arg_parser.add_argument("--lookups", type=int, default=10_000)
+    arg_parser.add_argument("--threads", type=int, default=8)
+    arg_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Keep the lookup cache on (default: off, measuring the database)",
+    )
+    arg_parser.add_argument("--rows", type=int, default=1_000_000)
+    arg_parser.add_argument("--methods", default="copy,binary,values")
+    arg_parser.add_argument("--import-workers", type=int, default=1)
+    arg_parser.add_argument("--pg-bin", help="Directory with initdb and pg_ctl")
+    arg_parser.add_argument(
+        "--keep-cluster",
+        action="store_true",
+        help="Keep the temporary cluster directory (for reading server.log)",
+    )
+    args = arg_parser.parse_args(argv)
+    args.methods = [method for method in args.methods.split(",") if method]
+    if args.lookups < 2 or args.threads < 1 or not args.methods:
+        arg_parser.error("need --lookups >= 2, --threads >= 1 and a load method")
+    return args
+
+
+def main(argv=None):
+    """
+    Run the benchmarks on a throwaway cluster and write the JSON report.
+
+    Args:
+        argv (list or None): Command-line arguments, defaults to sys.argv
+    """
+    args = parse_args(argv)
+    cluster = ThrowawayCluster(find_pg_bin(args.pg_bin), keep=args.keep_cluster)
+    report = {
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+    cluster.start()
+    try:
+        report["server_version"] = cluster.create_databases(
+            ROSTER_DBNAME, REAL_ESTATE_DBNAME
+        )
+        cluster.configure_environment(args.threads, args.cache)
+        if args.only in (None, "roster"):
+            report["roster"] = bench_roster(
+                args.students, args.lookups, args.threads, args.seed_workers
+            )
+            latency = report["roster"]["lookup_latency"]
+            print(
+                f"DB.main p50/p95/p99: {latency['p50_ms']:.3f}/"
+                f"{latency['p95_ms']:.3f}/{latency['p99_ms']:.3f} ms"
+            )
+        if args.only in (None, "import"):
+            csv_path = os.path.join(cluster.root, "scaled.csv")
+            report["import"] = bench_import(
+                csv_path, args.rows, args.methods, args.import_workers
+            )
+    finally:
+        cluster.stop()
+
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(report, output, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""
+Asyncio Database Connection and Query Management Class
+
+This module provides AsyncDB, an asyncio counterpart of the DB class in db.py
+with the same methods (initialize_connection, execute_query, close_connection,
+main), built on psycopg2's asynchronous connection mode. An asyncio server can
+run many lookups concurrently on a small pool of connections without blocking
+the event loop or needing one thread per lookup.
+
+Features:
+- psycopg2 async connections (async_=1) polled from the asyncio event loop
+- Small shared pool of connections, each running one query at a time
+- Same lookup cache as the blocking DB class
+- Concurrent main() calls on a single AsyncDB instance
+
+Dependencies:
+- psycopg2: PostgreSQL adapter for Python
+- db module: Database configuration and lookup cache
+- asyncio: Built-in event loop
+
+Usage:
+    db = AsyncDB()
+    result = await db.main("Victor")
+    results = await asyncio.gather(*(db.main(name) for name in names))
+    await db.pool.close()
+"""
+
+import asyncio
+import os
+import psycopg2
+from psycopg2 import extensions
+from db import (
+    CACHE_LISTEN,
+    CLASS_ROASTER_DBNAME,
+    HOST,
+    PASSWORD,
+    PORT,
+    USER,
+    lookup_cache,
+    start_cache_listener,
+)
+from lookup_cache import MISSING
+
+# Maximum number of async connections opened by the shared pool
+ASYNC_POOL_SIZE = int(os.getenv("CLASS_ROASTER_ASYNC_POOL_SIZE", "5"))
+
+
+async def wait_for(connection):
+    """
+    Drive an asynchronous psycopg2 operation to completion.
+
+    psycopg2 reports through poll() whether it needs the socket to become
+    readable or writable; the event loop is asked to watch the socket and the
+    coroutine is suspended until it is ready, so other tasks keep running.
+
+    Args:
+        connection: psycopg2 connection opened with async_=1
+
+    Raises:
+        psycopg2.OperationalError: If poll() returns an unexpected state
+        psycopg2.Error: Any error raised by the connection or query
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        state = connection.poll()
+        if state == extensions.POLL_OK:
+            return
+        ready = loop.create_future()
+
+        def wake():
+            if not ready.done():
+                ready.set_result(None)
+
+        fileno = connection.fileno()
+        if state == extensions.POLL_READ:
+            loop.add_reader(fileno, wake)
+            try:
+                await ready
+            finally:
+                loop.remove_reader(fileno)
+        elif state == extensions.POLL_WRITE:
+            loop.add_writer(fileno, wake)
+            try:
+                await ready
+            finally:
+                loop.remove_writer(fileno)
+        else:
+            raise psycopg2.OperationalError(f"Unexpected poll() state {state}")
+
+
+class AsyncConnectionPool:
+    """
+    Pool of asynchronous connections shared by AsyncDB instances.
+
+    Connections are opened lazily up to maxsize; when all are busy, acquire()
+    waits until one is released. Async connections are always in autocommit
+    mode, so nothing needs to be reset between users.
+
+    The pool's state belongs to one event loop at a time: when it is used from
+    a different loop (e.g. a second asyncio.run() in the same process), the
+    idle connections are closed and the pool starts over on the new loop.
+    """
+
+    def __init__(self, maxsize=ASYNC_POOL_SIZE):
+        """
+        Args:
+            maxsize (int): Maximum number of open connections
+        """
+        self.maxsize = maxsize
+        self.idle = []  # Connections ready for reuse
+        self.in_use = set()  # Connections handed out on the current loop
+        self.opened = 0  # Connections currently open (idle or in use)
+        self.available = None  # Condition, created inside the running loop
+        self.loop = None  # Event loop the Condition and connections belong to
+
+    def bind_loop(self):
+        """
+        Attach the pool to the running event loop, resetting it on a change.
+
+        asyncio.Condition is bound to the loop it is first used on, so a new
+        Condition is created for a new loop. Idle connections of the previous
+        loop are closed, and connections still checked out there are closed
+        when they are released.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is self.loop:
+            return
+        while self.idle:
+            self.idle.pop().close()
+        self.in_use = set()
+        self.opened = 0
+        self.available = asyncio.Condition()
+        self.loop = loop
+
+    async def connect(self):
+        """
+        Open a new asynchronous connection.
+
+        Returns:
+            psycopg2 connection opened with async_=1
+        """
+        connection = psycopg2.connect(
+            dbname=CLASS_ROASTER_DBNAME,
+            user=USER,
+            password=PASSWORD,
+            port=PORT,
+            host=HOST,
+            async_=1,
+        )
+        await wait_for(connection)
+        return connection
+
+    async def acquire(self):
+        """
+        Take an open connection from the pool, opening or waiting as needed.
+
+        Returns:
+            psycopg2 async connection
+        """
+        self.bind_loop()
+        async with self.available:
+            while True:
+                while self.idle:
+                    connection = self.idle.pop()
+                    if not connection.closed:
+                        self.in_use.add(connection)
+                        return connection
+                    # Replace connections that were closed while idle
+                    self.opened -= 1
+                if self.opened < self.maxsize:
+                    self.opened += 1
+                    break
+                await self.available.wait()
+        try:
+            connection = await self.connect()
+        except BaseException:
+            async with self.available:
+                self.opened -= 1
+                self.available.notify()
+            raise
+        self.in_use.add(connection)
+        return connection
+
+    async def release(self, connection):
+        """
+        Return a connection to the pool (broken or busy connections are dropped).
+
+        Args:
+            connection: Connection obtained from acquire()
+        """
+        self.bind_loop()
+        if connection not in self.in_use:
+            # Checked out on an earlier event loop, which the pool left
+            connection.close()
+            return
+        async with self.available:
+            self.in_use.discard(connection)
+            if connection.closed or connection.isexecuting():
+                # A query cancelled mid-flight leaves the connection unusable
+                connection.close()
+                self.opened -= 1
+            else:
+                self.idle.append(connection)
+            self.available.notify()
+
+    async def close(self):
+        """
+        Close every idle connection.
+        """
+        self.bind_loop()
+        async with self.available:
+            while self.idle:
+                self.idle.pop().close()
+                self.opened -= 1
+
+
+# Pool shared by every AsyncDB instance that does not get its own
+shared_pool = AsyncConnectionPool()
+
+
+class AsyncDB:
+    """
+    Asynchronous database connection and query management class.
+
+    Mirrors DB: each method is a coroutine, connections come from an
+    AsyncConnectionPool, and lookups go through the shared lookup cache.
+    """
+
+    def __init__(self, pool=None):
+        """
+        Initialize the AsyncDB instance with default values.
+
+        Args:
+            pool (AsyncConnectionPool or None): Pool to borrow connections
+                                                from, defaults to shared_pool
+        """
+        self.pool = pool or shared_pool
+        self.connection = None  # Will store the borrowed async connection
+        self.cursor = None  # Will store the database cursor for query execution
+        # Parameterized query template - %s placeholder prevents SQL injection
+        # The lowest id wins for duplicate names, as in lookup_many(), since both
+        # paths fill the same cache
+        self.query_template = (
+            "select * from students where name = %s order by id limit 1"
+        )
+        self.cache = lookup_cache  # Read-through cache consulted by main()
+        if CACHE_LISTEN:
+            # Same invalidation thread as DB (the cache is shared)
+            start_cache_listener()
+
+    async def initialize_connection(self):
+        """
+        Borrow an async connection from the pool and create a cursor on it.
+        """
+        self.connection = await self.pool.acquire()
+        self.cursor = self.connection.cursor()
+
+    async def execute_query(self, name):
+        """
+        Execute the student lookup query with the provided name.
+
+        Args:
+            name (str): The student name to search for in the database
+
+        Returns:
+            tuple or None: The first matching student record as a tuple,
+                          or None if no student found with that name
+        """
+        # execute() only sends the query; wait_for() awaits the result
+        self.cursor.execute(self.query_template, (name,))
+        await wait_for(self.connection)
+        return self.cursor.fetchone()
+
+    async def close_connection(self):
+        """
+        Close the cursor and return the connection to the pool.
+
+        Safe to call if the checkout failed.
+        """
+        if self.cursor is not None:
+            self.cursor.close()
+            self.cursor = None
+        if self.connection is not None:
+            await self.pool.release(self.connection)
+            self.connection = None
+
+    async def main(self, name):
+        """
+        Main coroutine to execute a complete database lookup operation.
+
+        Each call works on its own AsyncDB handle sharing this instance's pool
+        and cache, so many main() calls can run concurrently on one instance.
+
+        Args:
+            name (str): The student name to search for
+
+        Returns:
+            tuple or None: Student record if found and operation successful,
+                          None if error occurs or student not found
+        """
+        cached = self.cache.get(name)
+        if cached is not MISSING:
+            return cached
+        generation = self.cache.generation
+        lookup = AsyncDB(self.pool)
+        try:
+            await lookup.initialize_connection()
+            result = await lookup.execute_query(name)
+            self.cache.set(name, result, generation)
+            return result
+        except Exception:
+            # Basic error handling, as in DB.main()
+            print("There was a problem!")
+        finally:
+            await lookup.close_connection()
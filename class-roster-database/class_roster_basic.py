@@ -2,21 +2,43 @@
 Class Roster Database Management Script
 
 This script demonstrates basic PostgreSQL database operations using psycopg2.
-It creates a students table and populates it with sample student data.
+It brings the students table schema up to date with idempotent, versioned
+migrations and populates it with sample student data.
 
 Features:
 - Environment variable configuration for database credentials
-- Table creation with automatic primary key
+- Versioned schema migrations recorded in a schema_migrations table
+- Table creation with automatic primary key and a btree index on name
+- Trigram (pg_trgm) GiST index on name for fuzzy and prefix search, skipped
+  with a warning where the extension cannot be created
+- Optional unique constraint on student names
 - Parameterized INSERT queries for SQL injection prevention
+- Change-notification trigger used to invalidate the lookup cache in db.py
+- Deterministic synthetic roster seeding streamed with COPY
+- Parallel seeding across worker processes, one connection each
 - Proper error handling and resource cleanup
 
 Dependencies:
 - psycopg2: PostgreSQL adapter for Python
 - python-dotenv: Environment variable loader
+
+Usage:
+    python class_roster_basic.py                 # Migrate and add sample students
+    python class_roster_basic.py --unique-names  # Also enforce unique names
+    python class_roster_basic.py --reset         # Empty the table first
+    python class_roster_basic.py --seed-students 1000000 --seed 42
+    python class_roster_basic.py --seed-students 100000000 --workers 8
 """
 
+import argparse
+import io
 import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
 import psycopg2
+from psycopg2 import errors
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -29,62 +51,570 @@ USER = os.getenv("CLASS_ROASTER_USER")  # Database username
 PASSWORD = os.getenv("CLASS_ROASTER_PASSWORD")  # Database password
 PORT = os.getenv("CLASS_ROASTER_PORT")  # Database port number
 
-try:
-    # Connect to an existing database
-    conn = psycopg2.connect(
-        dbname=CLASS_ROASTER_DBNAME, user=USER, password=PASSWORD, port=PORT, host=HOST
+# Synthetic seeding configuration
+# Rows generated and sent per COPY (one transaction each)
+SEED_CHUNK_SIZE = int(os.getenv("CLASS_ROASTER_SEED_CHUNK_SIZE", "50000"))
+# Rows per shard; each shard is generated independently from (seed, shard), so
+# the roster is the same whatever the number of workers
+SEED_SHARD_SIZE = int(os.getenv("CLASS_ROASTER_SEED_SHARD_SIZE", "1000000"))
+# Worker processes generating and loading shards in parallel
+SEED_WORKERS = int(os.getenv("CLASS_ROASTER_SEED_WORKERS", "1"))
+# Exponent of the Zipf-like popularity of name parts and foods
+# (the value of rank r is drawn about 1/r^s times as often as the most popular)
+ZIPF_EXPONENT = 1.0
+
+# Vocabularies for synthetic students (no tabs, newlines or backslashes, so
+# the values need no escaping in COPY text format)
+# fmt: off
+FIRST_NAMES = (
+    "Victor", "Esan", "Pelumi", "Ada", "Chinedu", "Funmi", "Tunde", "Ngozi",
+    "Emeka", "Aisha", "Kemi", "Ifeanyi", "Zainab", "Segun", "Amaka", "Bola",
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael",
+    "Linda", "David", "Elizabeth", "William", "Barbara", "Richard", "Susan",
+    "Joseph", "Jessica", "Thomas", "Sarah", "Carlos", "Maria", "Luis", "Ana",
+    "Wei", "Mei", "Hiroshi", "Yuki", "Arjun", "Priya", "Omar", "Fatima",
+    "Ivan", "Olga",
+)
+LAST_NAMES = (
+    "Okafor", "Adeyemi", "Eze", "Balogun", "Nwosu", "Ibrahim", "Okeke",
+    "Adebayo", "Obi", "Bello", "Smith", "Johnson", "Williams", "Brown",
+    "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez", "Hernandez",
+    "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore",
+    "Jackson", "Martin", "Lee", "Perez", "Thompson", "White", "Harris",
+    "Clark", "Lewis", "Robinson", "Walker", "Young", "Wang", "Li", "Zhang",
+    "Tanaka", "Sato", "Patel", "Khan", "Ivanov",
+)
+# Middle initials ("" for none) multiply the number of distinct names
+MIDDLE_INITIALS = ("",) + tuple("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+FOODS = (
+    "Rice", "Chicken", "Beans", "Pizza", "Jollof Rice", "Pasta", "Burger",
+    "Sushi", "Tacos", "Salad", "Fried Plantain", "Noodles", "Curry", "Steak",
+    "Pounded Yam", "Egusi Soup", "Suya", "Pancakes", "Fish", "Dumplings",
+    "Ramen", "Shawarma", "Ice Cream", "Moi Moi", "Puff Puff",
+)
+# fmt: on
+
+# Bookkeeping table listing the migrations already applied to this database
+migrations_table_creation_query = """
+CREATE TABLE IF NOT EXISTS schema_migrations (version integer PRIMARY KEY, description varchar, applied_at timestamptz NOT NULL DEFAULT now());
+"""
+
+# Create student table query
+# Uses serial for auto-incrementing primary key, varchar for text fields
+student_table_creation_query = """
+CREATE TABLE IF NOT EXISTS students (id serial PRIMARY KEY, name varchar, favorite_food varchar);
+"""
+
+# Btree index on name so lookups by name are index scans, not sequential scans
+student_name_index_query = """
+CREATE INDEX IF NOT EXISTS students_name_idx ON students (name);
+"""
+
+# Trigram index on name for DB.search(): similarity (%) and prefix/ILIKE
+# matches become index scans instead of sequential scans on large rosters.
+# GiST rather than GIN, because only GiST returns rows in distance order, so
+# ORDER BY name <-> term LIMIT k stops after k rows instead of scoring every
+# candidate
+# pg_trgm ships with PostgreSQL's contrib modules and is a trusted extension
+# from PostgreSQL 13, so the table owner can create it
+student_name_trigram_index_query = """
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS students_name_trgm_idx ON students USING gist (name gist_trgm_ops);
+"""
+
+# Trigger function announcing changed student names with NOTIFY
+# db.py listens on the students_changed channel and evicts those names from
+# its lookup cache; an empty payload means "clear everything"
+notify_function_query = """
+CREATE OR REPLACE FUNCTION notify_students_changed() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        PERFORM pg_notify('students_changed', '');
+        RETURN NULL;
+    END IF;
+    -- Notification payloads are limited to 8000 bytes, so very long
+    -- names fall back to clearing the whole cache
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.name IS NOT NULL THEN
+        PERFORM pg_notify('students_changed',
+            CASE WHEN octet_length(OLD.name) < 8000 THEN OLD.name ELSE '' END);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.name IS NOT NULL THEN
+        PERFORM pg_notify('students_changed',
+            CASE WHEN octet_length(NEW.name) < 8000 THEN NEW.name ELSE '' END);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# Fire the function for every changed row, and once per TRUNCATE
+# Dropping first makes the migration safe on tables that already have them
+# The WHEN condition lets a transaction switch row notifications off with
+# SET LOCAL roster.suppress_notify = 'on' (used by bulk seeding, which sends
+# one "clear everything" NOTIFY instead). Unlike a check inside the function,
+# WHEN is evaluated before the AFTER trigger event is queued, so suppressed
+# rows cost almost nothing
+notify_trigger_query = """
+DROP TRIGGER IF EXISTS students_notify_change ON students;
+CREATE TRIGGER students_notify_change
+AFTER INSERT OR UPDATE OR DELETE ON students
+FOR EACH ROW
+WHEN (coalesce(current_setting('roster.suppress_notify', true), '') <> 'on')
+EXECUTE FUNCTION notify_students_changed();
+DROP TRIGGER IF EXISTS students_notify_truncate ON students;
+CREATE TRIGGER students_notify_truncate
+AFTER TRUNCATE ON students
+FOR EACH STATEMENT EXECUTE FUNCTION notify_students_changed();
+"""
+
+# Ordered schema migrations: (version, description, SQL statements)
+# Every statement is idempotent, so databases created before migrations were
+# tracked are brought up to date without losing data
+MIGRATIONS = (
+    (1, "create students table", (student_table_creation_query,)),
+    (2, "index students.name", (student_name_index_query,)),
+    (3, "notify on students changes", (notify_function_query, notify_trigger_query)),
+    (4, "trigram index on students.name", (student_name_trigram_index_query,)),
+)
+
+# Migrations that only speed up DB.search() and need pg_trgm. If the extension
+# is not installed on the server or the role may not create it, they are
+# skipped with a warning (and retried on the next run) instead of failing the
+# setup; DB.search() is then unavailable
+OPTIONAL_MIGRATIONS = {4}
+# Errors raised by CREATE EXTENSION in those cases: no privilege, or pg_trgm
+# not installed (UndefinedObject from PostgreSQL 15, UndefinedFile before)
+EXTENSION_UNAVAILABLE_ERRORS = (
+    errors.InsufficientPrivilege,
+    errors.UndefinedObject,
+    errors.UndefinedFile,
+)
+
+# Create INSERT INTO query using parameterized placeholders (%s)
+# Parameterized queries prevent SQL injection attacks
+# The NOT EXISTS guard keeps re-runs from inserting the same student twice
+insert_query = """
+INSERT INTO students (name, favorite_food)
+SELECT %(name)s, %(favorite_food)s
+WHERE NOT EXISTS (SELECT 1 FROM students WHERE name = %(name)s);
+"""
+
+# Sample students inserted by every run (skipped if already present)
+SAMPLE_STUDENTS = (("Victor", "Chicken"), ("Esan", "Rice"), ("Pelumi", "Beans"))
+
+
+def connect():
+    """
+    Open a connection to the class roster database.
+
+    Returns:
+        psycopg2 connection configured from the environment variables
+    """
+    return psycopg2.connect(
+        dbname=CLASS_ROASTER_DBNAME,
+        user=USER,
+        password=PASSWORD,
+        port=PORT,
+        host=HOST,
     )
 
-    # Open a cursor to perform database operations
-    cur = conn.cursor()
 
-    # Drop existing students table if it exists (clean slate approach)
-    cur.execute("DROP TABLE IF EXISTS students")
+def apply_migrations(cur):
+    """
+    Apply every migration that this database has not seen yet, in order.
+
+    Takes an exclusive lock on schema_migrations first, so two concurrent runs
+    cannot apply the same migration twice. Each OPTIONAL_MIGRATIONS entry runs
+    under a savepoint, so when pg_trgm is unavailable it is rolled back and
+    left unrecorded while the rest of the transaction goes on.
+
+    Args:
+        cur: Open psycopg2 cursor (the caller commits)
+
+    Returns:
+        list: Versions applied by this call
+    """
+    cur.execute(migrations_table_creation_query)
+    cur.execute("LOCK TABLE schema_migrations IN EXCLUSIVE MODE")
+    cur.execute("SELECT version FROM schema_migrations")
+    applied = {version for (version,) in cur.fetchall()}
+
+    newly_applied = []
+    for version, description, statements in MIGRATIONS:
+        if version in applied:
+            continue
+        if version in OPTIONAL_MIGRATIONS:
+            cur.execute("SAVEPOINT optional_migration")
+            try:
+                for statement in statements:
+                    cur.execute(statement)
+            except EXTENSION_UNAVAILABLE_ERRORS as e:
+                cur.execute("ROLLBACK TO SAVEPOINT optional_migration")
+                print(f"Skipped migration {version} ({description}):", e)
+                continue
+            cur.execute("RELEASE SAVEPOINT optional_migration")
+        else:
+            for statement in statements:
+                cur.execute(statement)
+        cur.execute(
+            "INSERT INTO schema_migrations (version, description) VALUES (%s, %s)",
+            (version, description),
+        )
+        newly_applied.append(version)
+    return newly_applied
+
 
-    # Create student table query
-    # Uses serial for auto-incrementing primary key, varchar for text fields
-    student_table_creation_query = """
-    CREATE TABLE IF NOT EXISTS students (id serial PRIMARY KEY, name varchar, favorite_food varchar);
+def zipf_cum_weights(size, exponent=ZIPF_EXPONENT):
     """
+    Cumulative weights making rank r about 1/r^exponent times as likely as
+    rank 1, for random.choices().
 
-    # Create INSERT INTO queries using parameterized placeholders (%s)
-    # Parameterized queries prevent SQL injection attacks
-    insert_query_1 = """
-    INSERT INTO students (name, favorite_food) VALUES (%s, %s);
+    Args:
+        size (int): Number of ranked values
+        exponent (float): Zipf exponent
+
+    Returns:
+        list: Cumulative weights, one per rank
     """
-    insert_query_2 = """
-    INSERT INTO students (name, favorite_food) VALUES (%s, %s);
+    return list(accumulate(1 / rank**exponent for rank in range(1, size + 1)))
+
+
+def popularity_order(values, seed, column):
     """
-    insert_query_3 = """
-    INSERT INTO students (name, favorite_food) VALUES (%s, %s);
+    Shuffle a vocabulary into the popularity order used by a seed.
+
+    Different seeds favour different values, while every shard of one seed
+    shares the same order.
+
+    Args:
+        values (tuple): Vocabulary
+        seed: Seed of the synthetic roster
+        column (int): Position of the vocabulary, so each gets its own order
+
+    Returns:
+        list: The values, most popular first
     """
+    order = list(values)
+    random.Random(f"{seed}:order:{column}").shuffle(order)
+    return order
 
-    # Execute a command to create a new table
-    cur.execute(student_table_creation_query)
 
-    # Execute commands to insert into student table
-    # Second parameter is a tuple containing the actual values to insert
-    cur.execute(insert_query_1, ("Victor", "Chicken"))
-    cur.execute(insert_query_2, ("Esan", "Rice"))
-    cur.execute(insert_query_3, ("Pelumi", "Beans"))
+def synthetic_students(count, seed=0, shard=0, chunk_size=SEED_CHUNK_SIZE):
+    """
+    Generate synthetic students deterministically, in chunks.
 
-    # Make the changes to the database persistent
-    # Without commit(), changes are only temporary in the transaction
-    conn.commit()
-    print("Table created and data inserted successfully!")
-
-except psycopg2.Error as e:
-    # Handle PostgreSQL-specific errors (connection issues, SQL errors, etc.)
-    print("Database Error:", e)
-
-except Exception as e:
-    # Handle any other unexpected errors
-    print("Unexpected Error", e)
-
-finally:
-    # Close all connections with the database
-    # Ensures proper cleanup even if errors occur
-    if cur is not None:
-        cur.close()
-    if conn is not None:
+    First names, middle initials, last names and favorite foods are each drawn
+    with Zipf-like popularity, so common names are shared by many students and
+    most of the roughly 62,000 possible names are rare, as in a real roster.
+    The same (count, seed, shard) always yields the same rows, whatever the
+    chunk size; different shards yield independent rows.
+
+    Args:
+        count (int): Number of students to generate
+        seed: Seed of the synthetic roster (int or str)
+        shard (int): Shard number, for splitting generation between workers
+        chunk_size (int): Maximum students per chunk
+
+    Yields:
+        list: (name, favorite_food) tuples
+    """
+    vocabularies = (FIRST_NAMES, MIDDLE_INITIALS, LAST_NAMES, FOODS)
+    # One generator per column keeps the output independent of the chunk size
+    columns = [
+        (
+            popularity_order(values, seed, column),
+            zipf_cum_weights(len(values)),
+            random.Random(f"{seed}:{shard}:{column}"),
+        )
+        for column, values in enumerate(vocabularies)
+    ]
+    remaining = count
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        firsts, middles, lasts, foods = (
+            rng.choices(values, cum_weights=weights, k=size)
+            for values, weights, rng in columns
+        )
+        names = [
+            f"{first} {middle}. {last}" if middle else f"{first} {last}"
+            for first, middle, last in zip(firsts, middles, lasts)
+        ]
+        yield list(zip(names, foods))
+        remaining -= size
+
+
+def copy_students(cur, students):
+    """
+    Load students with COPY FROM STDIN (text format).
+
+    Args:
+        cur: Open psycopg2 cursor
+        students (list): (name, favorite_food) tuples from synthetic_students()
+    """
+    data = "".join(f"{name}\t{food}\n" for name, food in students)
+    cur.copy_expert("COPY students (name, favorite_food) FROM STDIN", io.StringIO(data))
+
+
+def seed_students(conn, count, seed=0, shard=0, chunk_size=SEED_CHUNK_SIZE):
+    """
+    Insert synthetic students, committing after every chunk.
+
+    Change notifications are suppressed while seeding (one NOTIFY per row
+    would flood the listeners); callers send a single "clear everything"
+    notification afterwards, see notify_students_reloaded().
+
+    Args:
+        conn: Open psycopg2 connection (not in autocommit mode)
+        count (int): Number of students to insert
+        seed: Seed of the synthetic roster
+        shard (int): Shard number passed to synthetic_students()
+        chunk_size (int): Students per COPY and per transaction
+
+    Returns:
+        int: Number of students inserted
+    """
+    inserted = 0
+    with conn.cursor() as cur:
+        for students in synthetic_students(count, seed, shard, chunk_size):
+            # SET LOCAL only lasts until the end of this chunk's transaction
+            cur.execute("SET LOCAL roster.suppress_notify = 'on'")
+            copy_students(cur, students)
+            conn.commit()
+            inserted += len(students)
+    return inserted
+
+
+def seed_shards(count, shard_size=SEED_SHARD_SIZE):
+    """
+    Split a number of synthetic students into fixed-size shards.
+
+    Args:
+        count (int): Total number of students
+        shard_size (int): Students per shard (the last shard may be smaller)
+
+    Returns:
+        list: (shard number, students in the shard) tuples
+    """
+    return [
+        (shard, min(shard_size, count - start))
+        for shard, start in enumerate(range(0, count, shard_size))
+    ]
+
+
+def seed_shard(task):
+    """
+    Generate and load one shard of synthetic students over its own connection.
+
+    Runs inside a worker process; every chunk is committed independently.
+
+    Args:
+        task (tuple): (shard number, students in the shard, seed, chunk size)
+
+    Returns:
+        tuple: (shard number, students inserted)
+    """
+    shard, count, seed, chunk_size = task
+    conn = connect()
+    try:
+        return shard, seed_students(conn, count, seed, shard, chunk_size)
+    finally:
         conn.close()
+
+
+def seed_parallel(
+    conn, count, seed=0, workers=SEED_WORKERS, chunk_size=SEED_CHUNK_SIZE
+):
+    """
+    Seed synthetic students, generating and loading shards in parallel.
+
+    Generating rows is CPU-bound in Python, so each worker process builds its
+    own shards and COPYs them over its own connection into the students
+    table. Triggers are not disabled (ALTER TABLE would lock out readers);
+    each chunk suppresses notifications with SET LOCAL instead, and a single
+    "clear everything" notification is sent at the end.
+
+    Args:
+        conn: Open psycopg2 connection used for the final notification, and
+              for loading when workers is 1
+        count (int): Number of students to insert
+        seed: Seed of the synthetic roster
+        workers (int): Number of worker processes
+        chunk_size (int): Students per COPY and per transaction
+
+    Returns:
+        int: Number of students inserted
+    """
+    tasks = [
+        (shard, shard_count, seed, chunk_size)
+        for shard, shard_count in seed_shards(count)
+    ]
+    inserted = 0
+    if workers <= 1:
+        for shard, shard_count, _, _ in tasks:
+            inserted += seed_students(conn, shard_count, seed, shard, chunk_size)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for shard, shard_inserted in pool.map(seed_shard, tasks):
+                inserted += shard_inserted
+                print(f"Shard {shard + 1}/{len(tasks)} loaded")
+    notify_students_reloaded(conn)
+    return inserted
+
+
+def notify_students_reloaded(conn):
+    """
+    Refresh planner statistics and tell cache listeners to drop everything.
+
+    Args:
+        conn: Open psycopg2 connection (not in autocommit mode)
+    """
+    with conn.cursor() as cur:
+        cur.execute("ANALYZE students")
+        # An empty payload clears every db.py lookup cache
+        cur.execute("SELECT pg_notify('students_changed', '')")
+    conn.commit()
+
+
+def add_unique_name_constraint(cur):
+    """
+    Enforce unique student names (optional, since duplicate names are legal
+    for a roster). Fails if the table already contains duplicates.
+
+    Args:
+        cur: Open psycopg2 cursor (the caller commits)
+    """
+    cur.execute(
+        "SELECT 1 FROM pg_constraint WHERE conname = 'students_name_key' "
+        "AND conrelid = 'students'::regclass"
+    )
+    if cur.fetchone() is None:
+        cur.execute(
+            "ALTER TABLE students ADD CONSTRAINT students_name_key UNIQUE (name)"
+        )
+
+
+def parse_args(argv=None):
+    """
+    Parse command-line options.
+
+    Args:
+        argv (list or None): Arguments to parse, defaults to sys.argv
+
+    Returns:
+        argparse.Namespace: Parsed options
+    """
+    arg_parser = argparse.ArgumentParser(
+        description="Migrate the students schema and insert sample students."
+    )
+    arg_parser.add_argument(
+        "--unique-names",
+        action="store_true",
+        help="Add a unique constraint on students.name",
+    )
+    arg_parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Remove every student (TRUNCATE) before inserting the samples",
+    )
+    arg_parser.add_argument(
+        "--seed-students",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Also insert N synthetic students",
+    )
+    arg_parser.add_argument(
+        "--seed",
+        default="0",
+        help="Seed for the synthetic students (same seed, same roster)",
+    )
+    arg_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=SEED_CHUNK_SIZE,
+        help=f"Synthetic students per COPY (default: {SEED_CHUNK_SIZE})",
+    )
+    arg_parser.add_argument(
+        "--workers",
+        type=int,
+        default=SEED_WORKERS,
+        help=f"Worker processes used for seeding (default: {SEED_WORKERS})",
+    )
+    args = arg_parser.parse_args(argv)
+    if args.seed_students < 0 or args.chunk_size <= 0 or args.workers <= 0:
+        arg_parser.error("--seed-students, --chunk-size and --workers must be positive")
+    if args.seed_students and args.unique_names:
+        arg_parser.error("synthetic students have duplicate names, drop --unique-names")
+    return args
+
+
+def main(argv=None):
+    """
+    Migrate the schema and insert the sample students in one transaction,
+    then seed synthetic students if requested.
+
+    Args:
+        argv (list or None): Command-line arguments, defaults to sys.argv
+    """
+    args = parse_args(argv)
+    conn = None
+    cur = None
+    try:
+        # Connect to an existing database
+        conn = connect()
+
+        # Open a cursor to perform database operations
+        cur = conn.cursor()
+
+        # Bring the schema up to date; existing rows are kept
+        applied = apply_migrations(cur)
+        if applied:
+            print("Applied migrations:", ", ".join(map(str, applied)))
+
+        if args.unique_names:
+            add_unique_name_constraint(cur)
+
+        if args.reset:
+            # TRUNCATE also notifies db.py listeners to clear their caches
+            cur.execute("TRUNCATE students RESTART IDENTITY")
+
+        # Execute commands to insert into student table
+        # Second parameter is a dict containing the actual values to insert
+        for name, favorite_food in SAMPLE_STUDENTS:
+            cur.execute(insert_query, {"name": name, "favorite_food": favorite_food})
+
+        # Make the changes to the database persistent
+        # Without commit(), changes are only temporary in the transaction
+        conn.commit()
+        print("Schema migrated and data inserted successfully!")
+
+        if args.seed_students:
+            started = time.perf_counter()
+            inserted = seed_parallel(
+                conn, args.seed_students, args.seed, args.workers, args.chunk_size
+            )
+            elapsed = time.perf_counter() - started
+            print(
+                f"Seeded {inserted} synthetic students in {elapsed:.1f} s "
+                f"({inserted / elapsed:.0f} rows/s)."
+            )
+
+    except psycopg2.Error as e:
+        # Handle PostgreSQL-specific errors (connection issues, SQL errors, etc.)
+        print("Database Error:", e)
+
+    except Exception as e:
+        # Handle any other unexpected errors
+        print("Unexpected Error", e)
+
+    finally:
+        # Close all connections with the database
+        # Ensures proper cleanup even if errors occur
+        if cur is not None:
+            cur.close()
+        if conn is not None:
+            conn.close()
+
+
+if __name__ == "__main__":
+    main()
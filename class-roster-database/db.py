@@ -7,22 +7,47 @@ within a reusable class structure.
 
 Features:
 - Object-oriented database connection management
+- Persistent, thread-safe connection pool with health checks on checkout
+- Server-side prepared statement for lookups, prepared once per pooled connection
+- Read-through LRU cache with TTL in front of the lookup query
+- LISTEN/NOTIFY listener thread that evicts cache entries when students change
 - Parameterized query execution for student lookups
+- Batch lookups of many names with a single ANY() query
+- Optional statement timing and pool wait tracing (tracing module)
+- Fuzzy and prefix name search backed by a pg_trgm GiST trigram index
+- Streaming of every student name through a named server-side cursor
 - Automatic resource cleanup with connection management methods
 - Centralized database operations within a class
 
 Dependencies:
 - psycopg2: PostgreSQL adapter for Python
 - python-dotenv: Environment variable loader
+- lookup_cache module: In-process LRU/TTL cache
+- tracing module: Query timing hooks shared with the real estate scripts
 
 Usage:
     db = DB()
     result = db.main("Victor")  # Returns student record for Victor
+    results = db.lookup_many(["Victor", "Esan"])  # {name: record or None}
+    matches = db.search("Vic", limit=5)  # Closest names first
+    for student_id, name in db.stream_names():  # Every name, streamed
+        ...
 """
 
 import os
+import select
+import sys
+import threading
+import time
+import weakref
 import psycopg2
+from psycopg2 import errors, extensions, pool
 from dotenv import load_dotenv
+from lookup_cache import MISSING, LookupCache
+
+# tracing.py is shared by both projects and lives in the repository root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import tracing  # noqa: E402
 
 # Load environment variables from .env file
 load_dotenv()
@@ -34,6 +59,241 @@ USER = os.getenv("CLASS_ROASTER_USER")  # Database username
 PASSWORD = os.getenv("CLASS_ROASTER_PASSWORD")  # Database password
 PORT = os.getenv("CLASS_ROASTER_PORT")  # Database port number
 
+# Connection pool configuration
+# Upper bound on open connections; checkouts wait when all are in use
+POOL_MAXCONN = int(os.getenv("CLASS_ROASTER_POOL_MAXCONN", "5"))
+# Idle connections kept open between lookups. psycopg2 closes every connection
+# returned while this many are already idle, so anything below POOL_MAXCONN
+# makes concurrent lookups reconnect (and re-PREPARE); defaults to POOL_MAXCONN
+POOL_MINCONN = min(
+    int(os.getenv("CLASS_ROASTER_POOL_MINCONN", str(POOL_MAXCONN))), POOL_MAXCONN
+)
+# Connections idle for longer than this many seconds are pinged before reuse
+POOL_PING_AFTER = float(os.getenv("CLASS_ROASTER_POOL_PING_AFTER", "30"))
+
+# Lookup cache configuration
+# Maximum cached names (0 disables the cache) and seconds each entry stays valid
+CACHE_SIZE = int(os.getenv("CLASS_ROASTER_CACHE_SIZE", "1024"))
+CACHE_TTL = float(os.getenv("CLASS_ROASTER_CACHE_TTL", "60"))
+# Start the invalidation listener with the first DB instance. On by default
+# whenever the cache is, so writes are not served stale for up to CACHE_TTL
+# ("0" disables it, e.g. for read-only workloads)
+CACHE_LISTEN = CACHE_SIZE > 0 and os.getenv("CLASS_ROASTER_CACHE_LISTEN", "1") == "1"
+# Rows fetched per round trip when streaming names with a server-side cursor
+NAME_STREAM_SIZE = int(os.getenv("CLASS_ROASTER_NAME_STREAM_SIZE", "5000"))
+# Channel the students trigger (see class_roster_basic.py) notifies on
+NOTIFY_CHANNEL = "students_changed"
+
+# Student records by name, shared by every DB instance in the process
+lookup_cache = LookupCache(CACHE_SIZE, CACHE_TTL)
+
+_listener = None  # CacheInvalidationListener started by start_cache_listener()
+_pool = None  # Shared ThreadedConnectionPool, created on first use
+_pool_lock = threading.Lock()  # Guards lazy creation of the pool
+_pool_slots = threading.BoundedSemaphore(POOL_MAXCONN)  # Free checkout slots
+_last_used = weakref.WeakKeyDictionary()  # connection -> time it was returned
+_prepared = weakref.WeakSet()  # Connections on which the lookup is PREPAREd
+
+
+def get_pool():
+    """
+    Return the process-wide connection pool, creating it on first use.
+
+    Returns:
+        psycopg2.pool.ThreadedConnectionPool: Pool shared by every DB instance
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = pool.ThreadedConnectionPool(
+                POOL_MINCONN,
+                POOL_MAXCONN,
+                dbname=CLASS_ROASTER_DBNAME,
+                user=USER,
+                password=PASSWORD,
+                port=PORT,
+                host=HOST,
+                # Times every statement when QUERY_TRACE is set
+                connection_factory=tracing.connection_factory(),
+            )
+        return _pool
+
+
+def connection_is_healthy(connection):
+    """
+    Check a pooled connection before handing it out.
+
+    Closed connections and connections whose server link is known to be lost
+    are rejected without a round trip. Connections that sat idle for more than
+    POOL_PING_AFTER seconds are additionally pinged with SELECT 1, since the
+    server or a proxy may have dropped them in the meantime.
+
+    Args:
+        connection: psycopg2 connection taken from the pool
+
+    Returns:
+        bool: True if the connection can be used
+    """
+    if connection.closed:
+        return False
+    status = connection.info.transaction_status
+    if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+        return False
+    last_used = _last_used.get(connection)  # None for a newly opened connection
+    if last_used is not None and time.monotonic() - last_used > POOL_PING_AFTER:
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        except psycopg2.Error:
+            return False
+    return True
+
+
+def checkout_connection():
+    """
+    Take a healthy connection from the pool, waiting if all are in use.
+
+    Unhealthy connections are closed and replaced by new ones.
+
+    Returns:
+        psycopg2 connection in autocommit mode (lookups are read-only, so no
+        transaction is left open while the connection sits in the pool)
+    """
+    started = time.perf_counter()
+    _pool_slots.acquire()
+    try:
+        connection_pool = get_pool()
+        while True:
+            connection = connection_pool.getconn()
+            if connection_is_healthy(connection):
+                break
+            connection_pool.putconn(connection, close=True)
+        if not connection.autocommit:
+            connection.autocommit = True
+        # Includes waiting for a free slot, opening and health checks
+        tracing.record_pool_wait(time.perf_counter() - started)
+        return connection
+    except BaseException:
+        _pool_slots.release()
+        raise
+
+
+def return_connection(connection):
+    """
+    Give a connection back to the pool and free its checkout slot.
+
+    Args:
+        connection: psycopg2 connection obtained from checkout_connection()
+    """
+    try:
+        _last_used[connection] = time.monotonic()
+        get_pool().putconn(connection)
+    finally:
+        _pool_slots.release()
+
+
+def close_pool():
+    """
+    Close every pooled connection. The next checkout creates a new pool.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+
+
+class CacheInvalidationListener(threading.Thread):
+    """
+    Background thread that keeps the lookup cache consistent with the table.
+
+    Holds its own autocommit connection (outside the pool) with LISTEN on
+    NOTIFY_CHANNEL. Every notification payload is a student name whose
+    cache entry is evicted; an empty payload (e.g. after TRUNCATE) clears the
+    whole cache. The cache is also cleared whenever the listener (re)connects,
+    because notifications sent while it was not listening are lost.
+    """
+
+    def __init__(self, cache, poll_interval=1.0, reconnect_delay=5.0):
+        """
+        Args:
+            cache (LookupCache): Cache to invalidate
+            poll_interval (float): Seconds between checks of the stop flag
+            reconnect_delay (float): Seconds to wait before reconnecting
+        """
+        super().__init__(name="students-cache-listener", daemon=True)
+        self.cache = cache
+        self.poll_interval = poll_interval
+        self.reconnect_delay = reconnect_delay
+        self.stopping = threading.Event()
+
+    def run(self):
+        """
+        Listen until stop() is called, reconnecting after connection errors.
+        """
+        while not self.stopping.is_set():
+            try:
+                self.listen()
+            except psycopg2.Error as e:
+                print("Cache listener error, reconnecting:", e)
+                self.cache.clear()
+                self.stopping.wait(self.reconnect_delay)
+
+    def listen(self):
+        """
+        Open the listening connection and process notifications until stopped.
+        """
+        connection = psycopg2.connect(
+            dbname=CLASS_ROASTER_DBNAME,
+            user=USER,
+            password=PASSWORD,
+            port=PORT,
+            host=HOST,
+        )
+        try:
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+            # Entries cached before LISTEN took effect may already be stale
+            self.cache.clear()
+            while not self.stopping.is_set():
+                # Wait for the socket to become readable, waking up regularly
+                # to check the stop flag
+                readable, _, _ = select.select([connection], [], [], self.poll_interval)
+                if not readable:
+                    continue
+                connection.poll()
+                while connection.notifies:
+                    notify = connection.notifies.pop(0)
+                    if notify.payload:
+                        self.cache.invalidate(notify.payload)
+                    else:
+                        self.cache.clear()
+        finally:
+            connection.close()
+
+    def stop(self):
+        """
+        Ask the thread to exit and wait for it.
+        """
+        self.stopping.set()
+        self.join()
+
+
+def start_cache_listener():
+    """
+    Start the cache invalidation listener once per process.
+
+    Returns:
+        CacheInvalidationListener: The running listener
+    """
+    global _listener
+    with _pool_lock:
+        if _listener is None or not _listener.is_alive():
+            _listener = CacheInvalidationListener(lookup_cache)
+            _listener.start()
+        return _listener
+
 
 class DB:
     """
@@ -41,6 +301,7 @@ class DB:
 
     This class encapsulates database operations for student record retrieval,
     managing connections, cursors, and query execution in a structured way.
+    Connections are borrowed from a shared pool and returned after each lookup.
     """
 
     def __init__(self):
@@ -50,28 +311,79 @@ class DB:
         Sets up instance variables for connection management and defines
         the parameterized query template for student lookups.
         """
-        self.connection = None  # Will store the psycopg2 connection object
+        self.connection = None  # Will store the pooled psycopg2 connection object
         self.cursor = None  # Will store the database cursor for query execution
         # Parameterized query template - %s placeholder prevents SQL injection
-        self.query_template = "select * from students where name = %s"
+        # The lowest id wins for duplicate names, as in lookup_many(), since both
+        # paths fill the same cache
+        self.query_template = (
+            "select * from students where name = %s order by id limit 1"
+        )
+        # Batch lookup - one query for a whole list of names
+        # DISTINCT ON keeps a single record (lowest id) per name
+        self.many_query_template = (
+            "select distinct on (name) * from students "
+            "where name = any(%s) order by name, id"
+        )
+        # Fuzzy/prefix search - prefix matches rank first, then trigram
+        # similarity. Each branch is a top-k scan of the GiST trigram index
+        # in distance order (<-> is 1 - similarity), so the server stops after
+        # limit rows instead of scoring every candidate
+        # (%% is a literal % - the pg_trgm similarity operator)
+        self.search_query_template = (
+            "select id, name, favorite_food from ("
+            "(select id, name, favorite_food, true as prefix, "
+            "name <-> %(term)s as distance from students "
+            "where name ilike %(prefix)s "
+            "order by name <-> %(term)s limit %(limit)s) "
+            "union "
+            "(select id, name, favorite_food, name ilike %(prefix)s, "
+            "name <-> %(term)s from students "
+            "where name %% %(term)s "
+            "order by name <-> %(term)s limit %(limit)s)"
+            ") as matches "
+            "order by prefix desc, distance, name, id limit %(limit)s"
+        )
+        # Names added after a given id, oldest first (served by the primary key)
+        self.names_query_template = (
+            "select id, name from students "
+            "where id > %s and name is not null order by id"
+        )
+        # Name of the server-side prepared statement built from query_template
+        self.statement_name = "student_lookup"
+        self.cache = lookup_cache  # Read-through cache consulted by main()
+        if CACHE_LISTEN:
+            # Evict cached records when the students table changes
+            start_cache_listener()
 
     def initialize_connection(self):
         """
-        Establish connection to the PostgreSQL database.
+        Borrow a connection to the PostgreSQL database from the pool.
 
-        Creates both the database connection and cursor objects using
-        environment variables for configuration. These are stored as
-        instance variables for use by other methods.
+        Checks out a healthy pooled connection (opened with the environment
+        variable configuration) and creates a cursor on it. These are stored
+        as instance variables for use by other methods.
         """
-        self.connection = psycopg2.connect(
-            dbname=CLASS_ROASTER_DBNAME,
-            user=USER,
-            password=PASSWORD,
-            port=PORT,
-            host=HOST,
-        )
+        self.connection = checkout_connection()
         self.cursor = self.connection.cursor()
 
+    def prepare_query(self):
+        """
+        PREPARE the lookup on the current connection unless already done.
+
+        A prepared statement lives as long as the server session, so it is
+        created once per pooled connection and the server parses and plans
+        the query only then, instead of on every lookup.
+        """
+        if self.connection in _prepared:
+            return
+        # PREPARE uses numbered parameters instead of psycopg2 placeholders
+        self.cursor.execute(
+            f"PREPARE {self.statement_name} (varchar) AS "
+            + self.query_template.replace("%s", "$1")
+        )
+        _prepared.add(self.connection)
+
     def execute_query(self, name):
         """
         Execute the student lookup query with the provided name.
@@ -83,28 +395,156 @@ class DB:
             tuple or None: The first matching student record as a tuple,
                           or None if no student found with that name
         """
+        self.prepare_query()
         # Execute parameterized query - psycopg2 handles proper escaping
-        self.cursor.execute(self.query_template, (name,))
+        try:
+            self.cursor.execute(f"EXECUTE {self.statement_name} (%s)", (name,))
+        except errors.InvalidSqlStatementName:
+            # The session dropped its prepared statements (e.g. DISCARD ALL
+            # from a proxy); prepare again and retry once
+            _prepared.discard(self.connection)
+            self.prepare_query()
+            self.cursor.execute(f"EXECUTE {self.statement_name} (%s)", (name,))
         # fetchone() returns the first row of the result set or None
         return self.cursor.fetchone()
 
+    def lookup_many(self, names):
+        """
+        Look up many students at once with a single query.
+
+        Names already in the lookup cache are answered from it; the remaining
+        ones are resolved in one round trip with WHERE name = ANY(...), and
+        the results (including misses) are cached.
+
+        Args:
+            names (iterable): Student names; duplicates are looked up once
+
+        Returns:
+            dict: name -> student record tuple, or None if there is no student
+                  with that name, in the order the names were first given
+
+        Raises:
+            psycopg2.Error: If the database query fails
+        """
+        results = dict.fromkeys(names)
+        pending = []
+        for name in results:
+            cached = self.cache.get(name)
+            if cached is MISSING:
+                pending.append(name)
+            else:
+                results[name] = cached
+        if not pending:
+            return results
+
+        generation = self.cache.generation
+        try:
+            self.initialize_connection()
+            # psycopg2 adapts the Python list to a PostgreSQL array
+            self.cursor.execute(self.many_query_template, (pending,))
+            for record in self.cursor.fetchall():
+                # record[1] is the name column
+                results[record[1]] = record
+        finally:
+            self.close_connection()
+
+        for name in pending:
+            self.cache.set(name, results[name], generation)
+        return results
+
+    def search(self, term, limit=10):
+        """
+        Find the students whose names best match a partial or misspelled name.
+
+        Names starting with term (case-insensitive) come first, followed by
+        names similar to it by trigram similarity (pg_trgm's % operator, above
+        pg_trgm.similarity_threshold, 0.3 by default); each group is ordered by
+        trigram distance. Results are not cached. Needs the pg_trgm migrations
+        of class_roster_basic.py.
+
+        Args:
+            term (str): Name prefix or approximate name
+            limit (int): Maximum number of records to return
+
+        Returns:
+            list: Student record tuples, best match first (empty if none)
+
+        Raises:
+            psycopg2.Error: If the database query fails
+        """
+        # Escape LIKE wildcards so the term is matched literally
+        prefix = (
+            term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        )
+        try:
+            self.initialize_connection()
+            self.cursor.execute(
+                self.search_query_template,
+                {"term": term, "prefix": prefix, "limit": limit},
+            )
+            return self.cursor.fetchall()
+        finally:
+            self.close_connection()
+
+    def stream_names(self, after_id=0):
+        """
+        Stream the names of the students whose id is greater than after_id.
+
+        Uses a named (server-side) cursor, so the server keeps the result set
+        and rows arrive NAME_STREAM_SIZE at a time; the whole roster is never
+        held in memory at once. Server-side cursors only exist inside a
+        transaction, so autocommit is switched off while streaming. The pooled
+        connection is held until the generator is exhausted or closed.
+
+        Args:
+            after_id (int): Only students with a larger id are returned
+
+        Yields:
+            tuple: (id, name), in increasing id order
+
+        Raises:
+            psycopg2.Error: If the database query fails
+        """
+        connection = checkout_connection()
+        try:
+            connection.autocommit = False
+            with connection.cursor(name="student_names") as cursor:
+                cursor.itersize = NAME_STREAM_SIZE
+                cursor.execute(self.names_query_template, (after_id,))
+                yield from cursor
+            connection.commit()
+        finally:
+            try:
+                if not connection.closed:
+                    # Ends the transaction if streaming stopped early
+                    connection.rollback()
+                    connection.autocommit = True
+            finally:
+                return_connection(connection)
+
     def close_connection(self):
         """
-        Close database cursor and connection.
+        Close the database cursor and return the connection to the pool.
 
-        Properly releases database resources by closing both the cursor
-        and connection objects. Should be called after database operations
-        are complete.
+        Properly releases database resources by closing the cursor and handing
+        the connection back for reuse. Should be called after database
+        operations are complete; safe to call if the checkout failed.
         """
-        self.cursor.close()
-        self.connection.close()
+        if self.cursor is not None:
+            self.cursor.close()
+            self.cursor = None
+        if self.connection is not None:
+            return_connection(self.connection)
+            self.connection = None
 
     def main(self, name):
         """
         Main method to execute a complete database lookup operation.
 
-        Handles the full lifecycle of a database query: connection initialization,
-        query execution, and cleanup. Includes basic error handling.
+        Answers from the lookup cache when possible. Otherwise handles the full
+        lifecycle of a database query: connection checkout, query execution,
+        and returning the connection, then caches the result (including "not
+        found"). Includes basic error handling; failed lookups are not cached.
 
         Args:
             name (str): The student name to search for
@@ -113,11 +553,20 @@ class DB:
             tuple or None: Student record if found and operation successful,
                           None if error occurs or student not found
         """
+        # Serve repeated names without touching PostgreSQL
+        cached = self.cache.get(name)
+        if cached is not MISSING:
+            return cached
+        # Taken before querying, so a change notified while the query runs
+        # keeps the possibly stale result out of the cache
+        generation = self.cache.generation
         try:
-            # Establish database connection and cursor
+            # Borrow a pooled database connection and create a cursor
             self.initialize_connection()
-            # Execute the query and return the result
-            return self.execute_query(name)
+            # Execute the query, cache and return the result
+            result = self.execute_query(name)
+            self.cache.set(name, result, generation)
+            return result
         except:
             # Basic error handling - catches any exception during database operations
             print("There was a problem!")
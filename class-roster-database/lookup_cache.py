@@ -0,0 +1,134 @@
+"""
+In-Process Lookup Cache
+
+This module provides a small thread-safe cache used in front of database
+lookups. Entries are evicted in least-recently-used order once the cache is
+full and expire after a fixed time-to-live, and hit/miss counters make the
+cache's effectiveness visible.
+
+Features:
+- Size-bounded LRU eviction using an OrderedDict
+- Per-entry TTL based on a monotonic clock
+- Hit, miss and eviction counters
+- Caches negative results (None) as well as found records
+- Generation counter so a lookup racing with an invalidation is not cached
+
+Usage:
+    cache = LookupCache(maxsize=1024, ttl=60)
+    record = cache.get("Victor")
+    if record is MISSING:
+        record = load_from_database("Victor")
+        cache.set("Victor", record)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+# Returned by LookupCache.get() when a key is absent or expired; None cannot be
+# used because "no such student" is itself a cacheable result
+MISSING = object()
+
+
+class LookupCache:
+    """
+    Thread-safe LRU cache with a time-to-live on every entry.
+    """
+
+    def __init__(self, maxsize=1024, ttl=60.0, clock=time.monotonic):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of entries; 0 disables caching
+            ttl (float): Seconds an entry stays valid after it is stored
+            clock (callable): Time source in seconds, monotonic by default
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = OrderedDict()  # key -> (expiry time, value), oldest first
+        self.lock = threading.Lock()
+        self.hits = 0  # Lookups answered from the cache
+        self.misses = 0  # Lookups that were absent or expired
+        self.evictions = 0  # Entries dropped to respect maxsize
+        self.generation = 0  # Incremented by every invalidate() and clear()
+
+    def get(self, key):
+        """
+        Return the cached value for key and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or MISSING if absent or expired
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] <= self.clock():
+                if entry is not None:
+                    del self.entries[key]
+                self.misses += 1
+                return MISSING
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value, generation=None):
+        """
+        Store a value, evicting the least recently used entries if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache (None is allowed)
+            generation (int or None): Value of self.generation read before the
+                value was loaded; if an invalidation happened since, the value
+                may already be stale and is not stored
+        """
+        if self.maxsize <= 0:
+            return
+        with self.lock:
+            if generation is not None and generation != self.generation:
+                return
+            self.entries[key] = (self.clock() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key):
+        """
+        Drop a single entry if present.
+
+        Args:
+            key: Cache key
+        """
+        with self.lock:
+            self.entries.pop(key, None)
+            self.generation += 1
+
+    def clear(self):
+        """
+        Drop every entry (the counters are kept).
+        """
+        with self.lock:
+            self.entries.clear()
+            self.generation += 1
+
+    def stats(self):
+        """
+        Report the cache counters.
+
+        Returns:
+            dict: hits, misses, evictions, current size and hit rate
+        """
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self.entries),
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,157 @@
+"""
+Student Name Index for Autocompletion
+
+This module keeps every distinct student name in a sorted list so that names
+can be completed by prefix on the client, without a database round trip per
+keystroke. The index is loaded once by streaming the students table and then
+refreshed incrementally: only students with an id above the highest id seen
+so far are fetched.
+
+Features:
+- Sorted list of distinct names with bisect prefix lookups
+- Initial load streamed through DB.stream_names() (server-side cursor)
+- Incremental refresh using a high-water mark on students.id
+- Optional readline tab completion (skipped where readline is unavailable)
+
+Dependencies:
+- bisect: Built-in binary search on sorted lists
+- readline: Optional, line editing and tab completion
+
+Usage:
+    index = NameIndex()
+    index.refresh(db)  # Full load the first time, new students afterwards
+    index.complete("Vi")  # ["Victor", "Vivian", ...]
+    install_completer(index)  # Tab-complete names in input()
+"""
+
+from bisect import bisect_left
+
+try:
+    import readline
+except ImportError:  # e.g. Windows without pyreadline
+    readline = None
+
+
+class NameIndex:
+    """
+    Sorted, duplicate-free list of student names supporting prefix search.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty index.
+        """
+        self.names = []  # Distinct names in sorted order
+        self.high_water = 0  # Highest students.id loaded so far
+
+    def __len__(self):
+        return len(self.names)
+
+    def refresh(self, db):
+        """
+        Add the names of students created since the last refresh.
+
+        The first refresh loads the whole table. Later ones only stream rows
+        with an id above the high-water mark, so renamed or deleted students
+        stay in the index until it is rebuilt; a name that no longer exists
+        simply finds no student when it is looked up.
+
+        Args:
+            db (DB): Database handler providing stream_names()
+
+        Returns:
+            int: Number of new distinct names added
+
+        Raises:
+            psycopg2.Error: If the database query fails
+        """
+        if not self.names:
+            # Bulk load: collect and sort once instead of inserting one by one.
+            # The mark only moves with the names, once the stream is complete,
+            # so a failed load is retried from the same point
+            names = set()
+            high_water = self.high_water
+            for student_id, name in db.stream_names(self.high_water):
+                names.add(name)
+                high_water = student_id
+            self.names = sorted(names)
+            self.high_water = high_water
+            return len(self.names)
+
+        added = 0
+        for student_id, name in db.stream_names(self.high_water):
+            if self.add(name):
+                added += 1
+            self.high_water = student_id
+        return added
+
+    def add(self, name):
+        """
+        Insert a name, keeping the list sorted.
+
+        Args:
+            name (str): Student name
+
+        Returns:
+            bool: True if the name was not in the index yet
+        """
+        position = bisect_left(self.names, name)
+        if position < len(self.names) and self.names[position] == name:
+            return False
+        self.names.insert(position, name)
+        return True
+
+    def complete(self, prefix, limit=None):
+        """
+        Return the names starting with prefix, in sorted order.
+
+        Args:
+            prefix (str): Beginning of a name (case-sensitive)
+            limit (int or None): Maximum number of names to return
+
+        Returns:
+            list: Matching names
+        """
+        matches = []
+        position = bisect_left(self.names, prefix)
+        while position < len(self.names) and self.names[position].startswith(prefix):
+            matches.append(self.names[position])
+            if limit is not None and len(matches) >= limit:
+                break
+            position += 1
+        return matches
+
+
+def install_completer(index):
+    """
+    Tab-complete student names from index in input() prompts.
+
+    Does nothing where the readline module is unavailable. Lines starting
+    with ":" (terminal commands) are not completed.
+
+    Args:
+        index (NameIndex): Names offered as completions
+
+    Returns:
+        bool: True if completion was installed
+    """
+    if readline is None:
+        return False
+    matches = []
+
+    def completer(text, state):
+        # readline calls this with state 0, 1, 2... until it gets None
+        if state == 0:
+            line = readline.get_line_buffer()
+            matches[:] = [] if line.startswith(":") else index.complete(text)
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(completer)
+    # Complete the whole line, since names may contain spaces
+    readline.set_completer_delims("")
+    if "libedit" in (readline.__doc__ or ""):
+        # macOS ships libedit, which uses a different binding syntax
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+    return True
@@ -10,18 +10,183 @@ Features:
 - Integration with custom DB class for database operations
 - Formatted output display of student information
 - Simple user experience for database queries
+- Suggests the closest names when there is no exact match
+- Interactive loop that reuses pooled connections across questions
+- Per-query latency display and batch lookups from a file
+- Tab completion of student names from a client-side name index
+- Non-interactive batch mode writing CSV or JSON Lines to stdout
 
 Dependencies:
 - db module: Custom database management class
+- name_index module: Sorted name index and readline completion
 - Built-in input() function for user interaction
 
 Usage:
-    python terminal.py
-    # Prompts user for student name and displays their favorite food
+    python terminal.py         # Ask questions until :quit
+    python terminal.py --once  # Ask a single question and exit
+    python terminal.py --no-complete  # Loop without loading names for Tab
+    python terminal.py --batch names.txt > results.csv  # One name per line
+    python terminal.py --batch - --format jsonl < names.txt  # From stdin
+
+Commands inside the loop:
+    :time          Toggle the per-query latency display
+    :batch <file>  Look up every name in a file (one name per line)
+    :refresh       Load students added since the names were last loaded
+    :help          List the commands
+    :quit          Leave the loop
 """
 
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from itertools import islice
+
 # Import the custom DB class from the db module
-from db import DB
+from db import DB, close_pool
+from name_index import NameIndex, install_completer
+
+# Number of close matches suggested when a name is not found
+SUGGESTION_LIMIT = 5
+# Names resolved per query by :batch
+BATCH_SIZE = int(os.getenv("CLASS_ROASTER_BATCH_SIZE", "500"))
+# Seconds between automatic refreshes of the completion names (0 disables)
+COMPLETION_REFRESH = float(os.getenv("CLASS_ROASTER_COMPLETION_REFRESH", "60"))
+
+# Output formats of --batch
+OUTPUT_FORMATS = ("csv", "jsonl")
+# Columns written for every name in batch mode
+RESULT_FIELDS = ("name", "found", "id", "favorite_food")
+
+# Help text printed by :help
+COMMANDS_HELP = """Commands:
+  :time          Toggle the per-query latency display
+  :batch <file>  Look up every name in a file (one name per line)
+  :refresh       Load students added since the names were last loaded
+  :help          List the commands
+  :quit          Leave the loop
+Anything else is looked up as a student name."""
+
+
+def read_names(lines):
+    """
+    Extract student names from lines of text, one name per line.
+
+    Surrounding whitespace is stripped and blank lines are skipped.
+
+    Args:
+        lines (iterable): Lines of text (e.g. an open file)
+
+    Yields:
+        str: Student names, in input order
+    """
+    for line in lines:
+        name = line.strip()
+        if name:
+            yield name
+
+
+def resolve_names(db, names, chunk_size=BATCH_SIZE):
+    """
+    Look up a stream of names, one query per chunk of chunk_size names.
+
+    Only one chunk is held in memory at a time, so arbitrarily long inputs can
+    be processed.
+
+    Args:
+        db (DB): Database handler used for the lookups
+        names (iterable): Student names (duplicates are reported every time)
+        chunk_size (int): Maximum names resolved per query
+
+    Yields:
+        tuple: (name, student record tuple or None), in input order
+
+    Raises:
+        psycopg2.Error: If a database query fails
+    """
+    names = iter(names)
+    while True:
+        chunk = list(islice(names, chunk_size))
+        if not chunk:
+            return
+        records = db.lookup_many(chunk)
+        for name in chunk:
+            yield name, records[name]
+
+
+def write_results(results, output, output_format="csv"):
+    """
+    Write lookup results as CSV (with a header row) or JSON Lines.
+
+    Every input name produces one record with RESULT_FIELDS; id and
+    favorite_food are empty (CSV) or null (JSON) for names not found.
+
+    Args:
+        results (iterable): (name, student record tuple or None) pairs
+        output: Text stream to write to (e.g. sys.stdout)
+        output_format (str): "csv" or "jsonl"
+
+    Returns:
+        tuple: (number of names found, number of names not found)
+    """
+    found = missing = 0
+    writer = None
+    if output_format == "csv":
+        writer = csv.writer(output)
+        writer.writerow(RESULT_FIELDS)
+    for name, record in results:
+        if record is None:
+            missing += 1
+            student_id = favorite_food = None
+        else:
+            found += 1
+            # record[0] = student ID, record[2] = favorite food
+            student_id, favorite_food = record[0], record[2]
+        values = (name, record is not None, student_id, favorite_food)
+        if writer is not None:
+            writer.writerow(values)
+        else:
+            output.write(json.dumps(dict(zip(RESULT_FIELDS, values))) + "\n")
+    return found, missing
+
+
+def run_batch(path, output_format="csv", output=None):
+    """
+    Resolve the names listed in a file (or stdin) and write the results.
+
+    Names are streamed and resolved BATCH_SIZE at a time with one query per
+    chunk, so memory use does not grow with the input. A summary is printed
+    to stderr, keeping stdout machine-readable.
+
+    Args:
+        path (str): Text file with one name per line, or "-" for stdin
+        output_format (str): "csv" or "jsonl"
+        output: Text stream for the results, defaults to sys.stdout
+
+    Returns:
+        int: Process exit status (0 on success, 1 on error)
+    """
+    output = output or sys.stdout
+    started = time.perf_counter()
+    try:
+        if path == "-":
+            names_file = sys.stdin
+        else:
+            names_file = open(path, encoding="utf-8")
+        with names_file:
+            results = resolve_names(DB(), read_names(names_file))
+            found, missing = write_results(results, output, output_format)
+    except OSError as e:
+        print("Cannot read names:", e, file=sys.stderr)
+        return 1
+    except Exception as e:
+        print("There was a problem!", e, file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - started
+    print(f"{found} found, {missing} not found in {elapsed:.2f} s.", file=sys.stderr)
+    return 0
 
 
 class Terminal:
@@ -42,33 +207,267 @@ class Terminal:
         uses DB functionality without inheriting from it.
         """
         self.db = DB()  # Instantiate database handler for student queries
+        self.show_time = True  # Print the latency of every query (:time)
+        self.names = NameIndex()  # Student names offered for Tab completion
+        self.names_loaded_at = None  # time.monotonic() of the last refresh
 
     def ask_question(self):
         """
         Interactive method to get user input and display student information.
 
         Prompts the user for a student name, queries the database using the
-        DB class, and displays the formatted result. Assumes the query will
-        return a tuple with student data in a specific format.
+        DB class, and displays the formatted result.
+        """
+        # Get student name from user input
+        name = input("Who do you want to know about? ")
+        self.answer(name)
+
+    def answer(self, name):
+        """
+        Look up a student by name and display the formatted result.
+
+        When no student has that exact name, the closest matching names are
+        suggested instead.
 
         Expected database record format:
         - answer[0]: student ID (not displayed)
         - answer[1]: student name
         - answer[2]: student's favorite food
-        """
-        # Get student name from user input
-        name = input("Who do you want to know about? ")
 
+        Args:
+            name (str): The student name to look up
+        """
         # Query database using DB class main method
+        started = time.perf_counter()
         answer = self.db.main(name)
+        elapsed = time.perf_counter() - started
 
-        # Display formatted result using tuple indexing
-        # answer[1] = student name, answer[2] = favorite food
-        print(f"{answer[1]} likes to eat {answer[2]}.")
+        if answer is None:
+            # No exact match (or the lookup failed) - offer similar names
+            self.suggest(name)
+        else:
+            # Display formatted result using tuple indexing
+            # answer[1] = student name, answer[2] = favorite food
+            print(f"{answer[1]} likes to eat {answer[2]}.")
+        self.report_time(elapsed)
+
+    def suggest(self, name):
+        """
+        Print the students whose names most closely match a name.
+
+        Args:
+            name (str): The name that had no exact match
+        """
+        try:
+            matches = self.db.search(name, SUGGESTION_LIMIT)
+        except Exception:
+            matches = []
+        if not matches:
+            print(f"No student named {name} was found.")
+            return
+        print(f"No student named {name}. Did you mean:")
+        for match in matches:
+            # match[1] = student name, match[2] = favorite food
+            print(f"  {match[1]} (likes {match[2]})")
+
+    def batch(self, path):
+        """
+        Look up every name listed in a file and display the results.
+
+        Args:
+            path (str): Text file with one student name per line
+        """
+        started = time.perf_counter()
+        found = missing = 0
+        try:
+            with open(path, encoding="utf-8") as names_file:
+                for name, record in resolve_names(self.db, read_names(names_file)):
+                    if record is None:
+                        missing += 1
+                        print(f"{name}: not found")
+                    else:
+                        found += 1
+                        print(f"{record[1]} likes to eat {record[2]}.")
+        except OSError as e:
+            print("Cannot read names:", e)
+            return
+        except Exception as e:
+            print("There was a problem!", e)
+            return
+        print(f"{found} found, {missing} not found.")
+        self.report_time(time.perf_counter() - started)
+
+    def report_time(self, elapsed):
+        """
+        Print a query's latency if the latency display is on.
+
+        Args:
+            elapsed (float): Seconds the query took
+        """
+        if self.show_time:
+            print(f"({elapsed * 1000:.1f} ms)")
+
+    def handle_command(self, line):
+        """
+        Run one ":" command from the loop.
+
+        Args:
+            line (str): The command line, starting with ":"
+
+        Returns:
+            bool: False if the loop should stop, True otherwise
+        """
+        command, _, argument = line.partition(" ")
+        argument = argument.strip()
+        if command in (":quit", ":q", ":exit"):
+            return False
+        if command == ":time":
+            self.show_time = not self.show_time
+            print(f"Query timing {'on' if self.show_time else 'off'}.")
+        elif command == ":batch":
+            if argument:
+                self.batch(argument)
+            else:
+                print("Usage: :batch <file>")
+        elif command == ":refresh":
+            self.refresh_names(verbose=True)
+        elif command == ":help":
+            print(COMMANDS_HELP)
+        else:
+            print(f"Unknown command {command}. Type :help for the list.")
+        return True
+
+    def refresh_names(self, verbose=False):
+        """
+        Load the names of students added since the last refresh.
+
+        The first call streams every name; later calls only fetch students
+        above the index's high-water mark.
+
+        Args:
+            verbose (bool): Report the number of names added
+        """
+        started = time.perf_counter()
+        try:
+            added = self.names.refresh(self.db)
+        except Exception as e:
+            print("Cannot load names for completion:", e)
+            return
+        self.names_loaded_at = time.monotonic()
+        if verbose:
+            print(f"{added} new names, {len(self.names)} in total.")
+            self.report_time(time.perf_counter() - started)
+
+    def names_are_stale(self):
+        """
+        Check whether the completion names are due for an automatic refresh.
+
+        Returns:
+            bool: True if COMPLETION_REFRESH seconds passed since the last one
+        """
+        if self.names_loaded_at is None or COMPLETION_REFRESH <= 0:
+            return False
+        return time.monotonic() - self.names_loaded_at > COMPLETION_REFRESH
+
+    def run(self, complete=True):
+        """
+        Answer questions until :quit, end of input or Ctrl-C.
+
+        The Terminal's DB handler borrows pooled connections that stay open
+        between questions, so only the first lookup pays for connecting.
+
+        Args:
+            complete (bool): Load the student names and enable Tab completion
+        """
+        if complete and install_completer(self.names):
+            self.refresh_names()
+        print("Type a student name, or :help for commands.")
+        while True:
+            if self.names_are_stale():
+                # Between questions, so completion never waits on the database
+                self.refresh_names()
+            try:
+                line = input("> ").strip()
+            except (EOFError, KeyboardInterrupt):
+                print()
+                return
+            if not line:
+                continue
+            if line.startswith(":"):
+                if not self.handle_command(line):
+                    return
+            else:
+                self.answer(line)
+
+
+def parse_args(argv=None):
+    """
+    Parse command-line options.
+
+    Args:
+        argv (list or None): Arguments to parse, defaults to sys.argv
+
+    Returns:
+        argparse.Namespace: Parsed options
+    """
+    arg_parser = argparse.ArgumentParser(
+        description="Look up students' favorite foods."
+    )
+    mode = arg_parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--once",
+        action="store_true",
+        help="Ask a single question and exit instead of looping",
+    )
+    mode.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Look up every name in FILE (one per line, - for stdin) and exit",
+    )
+    arg_parser.add_argument(
+        "--no-complete",
+        action="store_true",
+        help="Do not load student names for Tab completion",
+    )
+    arg_parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="csv",
+        help="Output format of --batch (default: csv)",
+    )
+    return arg_parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Run the terminal interface.
+
+    Args:
+        argv (list or None): Command-line arguments, defaults to sys.argv
+
+    Returns:
+        int: Process exit status
+    """
+    args = parse_args(argv)
+    if args.batch is not None:
+        try:
+            return run_batch(args.batch, args.format)
+        finally:
+            close_pool()
 
+    # Create an instance of the Terminal class
+    t = Terminal()
+    try:
+        if args.once:
+            # Execute the interactive query method
+            t.ask_question()
+        else:
+            t.run(complete=not args.no_complete)
+    finally:
+        # Close the pooled connections held open across questions
+        close_pool()
+    return 0
 
-# Create an instance of the Terminal class
-t = Terminal()
 
-# Execute the interactive query method
-t.ask_question()
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,302 @@
+"""
+Scaled Real Estate CSV Generator
+
+This script produces arbitrarily large CSV files in the same format as the
+sample data (data/data.csv) for load testing the importer. The value
+distributions are learned from the sample, and rows are streamed to the
+output in chunks, so a 100M-row (20 GB) file needs no more memory than a
+small one.
+
+How rows are generated:
+- Each row starts from a property of the sample picked at random, which keeps
+  realistic combinations of city, zip code, beds, baths and property type
+- The house number is drawn from the sample's house numbers, independently
+  of the street, so addresses vary
+- Square footage and price are varied by a random factor around the sample
+  property's values (price follows the square footage); coordinates are
+  jittered slightly around the sample location
+- Sale dates follow the sample's sale date distribution, optionally spread
+  over more days
+
+Dependencies:
+- csv: Built-in CSV file processing
+- random: Deterministic pseudo-random generator
+
+Usage:
+    python generate_csv.py --rows 1000000 --output properties_1m.csv
+    python generate_csv.py --rows 100000000 --output - | gzip > properties_100m.csv.gz
+    python generate_csv.py --rows 10000000 --seed 7 --date-spread-days 365 --output big.csv
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+# Sample data file the distributions are learned from
+TEMPLATE_CSV = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "data.csv"
+)
+# Column order of the sample (and of every generated file)
+CSV_COLUMNS = (
+    "street", "city", "zip", "state", "beds", "baths", "sq__ft", "type",
+    "sale_date", "price", "latitude", "longitude",
+)  # fmt: skip
+# Rows generated and written per chunk
+CHUNK_SIZE = 10000
+# Spread of the random factors applied to square footage and price
+# (standard deviation of the log of the factor)
+SIZE_SIGMA = 0.1
+PRICE_SIGMA = 0.1
+# Maximum shift of generated coordinates, in degrees (about 200 m)
+COORDINATE_JITTER = 0.002
+# Layout of sale_date values, around a time zone abbreviation
+SALE_DATE_LAYOUT = ("%a %b %d %H:%M:%S", "%Y")
+
+
+def quote(value):
+    """
+    Quote a CSV field if it contains a delimiter, quote or line break.
+
+    Args:
+        value (str): Field value
+
+    Returns:
+        str: Value ready to be joined with commas
+    """
+    if any(char in value for char in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def learn_distributions(path=TEMPLATE_CSV):
+    """
+    Read the sample CSV and collect the values rows are drawn from.
+
+    Args:
+        path (str): Sample CSV file with the CSV_COLUMNS header
+
+    Returns:
+        dict: "properties" (tuples of per-property values), "house_numbers"
+              and "sale_dates" (one entry per sample row, so repeated values
+              keep their frequency)
+
+    Raises:
+        ValueError: If the file is not in the expected format or has no rows
+    """
+    properties = []
+    house_numbers = []
+    sale_dates = []
+    with open(path, newline="", encoding="utf-8") as csv_file:
+        reader = csv.DictReader(csv_file)
+        if tuple(reader.fieldnames or ()) != CSV_COLUMNS:
+            raise ValueError(f"{path} does not have the columns {CSV_COLUMNS}")
+        for row in reader:
+            number, _, street_name = row["street"].partition(" ")
+            if number.isdigit() and street_name:
+                house_numbers.append(int(number))
+            else:
+                # No house number to replace, keep the whole street
+                street_name = row["street"]
+            # The fields copied unchanged are joined once, here
+            location = ",".join(
+                quote(row[column])
+                for column in ("city", "zip", "state", "beds", "baths")
+            )
+            properties.append(
+                (
+                    quote(street_name),
+                    location,
+                    int(row["sq__ft"]),
+                    quote(row["type"]),
+                    int(row["price"]),
+                    float(row["latitude"]),
+                    float(row["longitude"]),
+                )
+            )
+            sale_dates.append(row["sale_date"])
+    if not properties:
+        raise ValueError(f"{path} has no data rows")
+    return {
+        "properties": properties,
+        "house_numbers": house_numbers or [1],
+        "sale_dates": sale_dates,
+    }
+
+
+def spread_sale_dates(sale_dates, days):
+    """
+    Derive sale dates shifted back by up to days days from the sample's.
+
+    Every sample date is paired with each shift, so the weekday mix and
+    relative frequencies of the sample are kept while the number of distinct
+    dates grows.
+
+    Args:
+        sale_dates (list): Sample sale_date strings, e.g.
+                           "Wed May 21 00:00:00 EDT 2008"
+        days (int): Largest shift in days
+
+    Returns:
+        list: Sale date strings in the sample's layout
+    """
+    spread = []
+    for raw in sale_dates:
+        # The time zone abbreviation is kept as text, not parsed
+        clock, zone, year = raw.rsplit(" ", 2)
+        moment = datetime.strptime(f"{clock} {year}", " ".join(SALE_DATE_LAYOUT))
+        for shift in range(days + 1):
+            shifted = moment - timedelta(days=shift)
+            spread.append(
+                f"{shifted.strftime(SALE_DATE_LAYOUT[0])} {zone} "
+                f"{shifted.strftime(SALE_DATE_LAYOUT[1])}"
+            )
+    return spread
+
+
+def generate_lines(distributions, count, seed=0, chunk_size=CHUNK_SIZE):
+    """
+    Generate CSV data lines (without header) in chunks.
+
+    The same distributions, count and seed always produce the same rows.
+
+    Args:
+        distributions (dict): Result of learn_distributions()
+        count (int): Number of rows to generate
+        seed: Seed of the random generator (int or str)
+        chunk_size (int): Maximum rows per chunk
+
+    Yields:
+        list: CSV lines, each ending with a newline
+    """
+    rng = random.Random(seed)
+    properties = distributions["properties"]
+    house_numbers = distributions["house_numbers"]
+    sale_dates = distributions["sale_dates"]
+    lognormal = rng.lognormvariate
+    uniform = rng.uniform
+    remaining = count
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        lines = []
+        for template, number, sale_date in zip(
+            rng.choices(properties, k=size),
+            rng.choices(house_numbers, k=size),
+            rng.choices(sale_dates, k=size),
+        ):
+            street, location, square_feet, kind, price, latitude, longitude = template
+            size_factor = lognormal(0.0, SIZE_SIGMA)
+            # A square footage of 0 means "unknown" in the sample and stays 0
+            generated_square_feet = round(square_feet * size_factor)
+            # Larger homes sell for proportionally more, plus some noise
+            generated_price = max(
+                1, round(price * size_factor * lognormal(0.0, PRICE_SIGMA))
+            )
+            lines.append(
+                f"{number} {street},{location},{generated_square_feet},{kind},"
+                f"{sale_date},{generated_price},"
+                f"{latitude + uniform(-COORDINATE_JITTER, COORDINATE_JITTER):.6f},"
+                f"{longitude + uniform(-COORDINATE_JITTER, COORDINATE_JITTER):.6f}\n"
+            )
+        yield lines
+        remaining -= size
+
+
+def generate_csv(output, count, template=TEMPLATE_CSV, seed=0, date_spread_days=0):
+    """
+    Write a CSV file of count generated rows, header included.
+
+    Args:
+        output: Text stream to write to (opened with newline="")
+        count (int): Number of data rows
+        template (str): Sample CSV to learn the distributions from
+        seed: Seed of the random generator
+        date_spread_days (int): Spread sale dates over this many extra days
+
+    Returns:
+        int: Number of data rows written
+    """
+    distributions = learn_distributions(template)
+    if date_spread_days > 0:
+        distributions["sale_dates"] = spread_sale_dates(
+            distributions["sale_dates"], date_spread_days
+        )
+    output.write(",".join(CSV_COLUMNS) + "\n")
+    written = 0
+    for lines in generate_lines(distributions, count, seed):
+        output.writelines(lines)
+        written += len(lines)
+    return written
+
+
+def parse_args(argv=None):
+    """
+    Parse command-line options.
+
+    Args:
+        argv (list or None): Arguments to parse, defaults to sys.argv
+
+    Returns:
+        argparse.Namespace: Parsed options
+    """
+    arg_parser = argparse.ArgumentParser(
+        description="Generate a large real estate CSV from the sample data."
+    )
+    arg_parser.add_argument(
+        "--rows", type=int, required=True, help="Number of data rows to generate"
+    )
+    arg_parser.add_argument(
+        "--output", default="-", help="Output file, - for stdout (default)"
+    )
+    arg_parser.add_argument(
+        "--template",
+        default=TEMPLATE_CSV,
+        help="Sample CSV the distributions are learned from",
+    )
+    arg_parser.add_argument(
+        "--seed", default="0", help="Seed for the generator (same seed, same file)"
+    )
+    arg_parser.add_argument(
+        "--date-spread-days",
+        type=int,
+        default=0,
+        help="Spread sale dates over this many days before the sample's dates",
+    )
+    args = arg_parser.parse_args(argv)
+    if args.rows < 0 or args.date_spread_days < 0:
+        arg_parser.error("--rows and --date-spread-days cannot be negative")
+    return args
+
+
+def main(argv=None):
+    """
+    Generate the CSV file described by the command-line options.
+
+    Args:
+        argv (list or None): Command-line arguments, defaults to sys.argv
+    """
+    args = parse_args(argv)
+    started = time.perf_counter()
+    if args.output == "-":
+        written = generate_csv(
+            sys.stdout, args.rows, args.template, args.seed, args.date_spread_days
+        )
+    else:
+        with open(args.output, "w", newline="", encoding="utf-8") as output:
+            written = generate_csv(
+                output, args.rows, args.template, args.seed, args.date_spread_days
+            )
+    elapsed = time.perf_counter() - started
+    # Progress goes to stderr so stdout can carry the CSV
+    print(
+        f"Generated {written} rows in {elapsed:.1f} s "
+        f"({written / elapsed if elapsed else 0:.0f} rows/s).",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Streaming CSV Pipeline Stages
+
+This module provides small generator stages that can be chained to stream a
+CSV file through an extract/transform/load pipeline. Every stage consumes an
+iterator and yields items lazily, so only a bounded amount of data is held in
+memory at any time and extra stages can be inserted anywhere in the chain.
+
+Each item carries the byte offset just past the CSV line it came from, so
+loaders can record exactly how far the file has been processed.
+
+Stages:
+- read_lines: byte range of a file -> (line, end offset)
+- parse_rows: lines -> (list of fields, end offset)
+- validate_rows: rejects rows whose field count does not match the header
+- batch_rows: rows -> (list of rows, end offset of the last row)
+- buffered: runs the upstream stages in a background thread behind a bounded queue
+
+Usage:
+    lines = read_lines("data.csv", start, end)
+    rows = validate_rows(parse_rows(lines), fieldnames)
+    for batch, offset in buffered(batch_rows(rows, 10000), maxsize=4):
+        ...
+"""
+
+import csv
+import queue
+import threading
+from itertools import islice
+
+
+class _EndOfStream:
+    """
+    Queue item that marks the end of a buffered stream.
+
+    Carries the exception that stopped the producer, if any.
+    """
+
+    def __init__(self, error=None):
+        self.error = error
+
+
+def read_lines(path, start, end):
+    """
+    Read the lines of a file that start inside the byte range [start, end).
+
+    Args:
+        path (str): Path to the file
+        start (int): Offset of the first line (must be a line start)
+        end (int): Offset where reading stops
+
+    Yields:
+        tuple: (decoded line, byte offset just past the line)
+    """
+    with open(path, mode="rb") as csv_file:
+        csv_file.seek(start)
+        position = start
+        while position < end:
+            line = csv_file.readline()
+            if not line:
+                return
+            position += len(line)
+            yield line.decode("utf-8"), position
+
+
+def parse_rows(lines):
+    """
+    Parse lines into CSV rows.
+
+    csv.reader pulls exactly one line per row (rows must not contain quoted
+    line breaks), so each row is paired with the offset of its own line.
+
+    Args:
+        lines (iterable): (line, end offset) pairs from read_lines()
+
+    Yields:
+        tuple: (list of field strings, byte offset just past the row)
+    """
+    offset = None
+
+    def text():
+        nonlocal offset
+        for line, offset in lines:
+            yield line
+
+    for row in csv.reader(text()):
+        yield row, offset
+
+
+def validate_rows(rows, fieldnames):
+    """
+    Check that every row has one value per header column.
+
+    Blank lines are skipped. A row with the wrong number of fields would shift
+    every later column when a batch is transposed, so it stops the pipeline.
+
+    Args:
+        rows (iterable): (fields, end offset) pairs from parse_rows()
+        fieldnames (list): Column names from the CSV header
+
+    Yields:
+        tuple: The valid (fields, end offset) pairs
+
+    Raises:
+        ValueError: If a row has too few or too many fields
+    """
+    expected = len(fieldnames)
+    for row, offset in rows:
+        if not row:
+            continue
+        if len(row) != expected:
+            raise ValueError(
+                f"Row ending at byte {offset} has {len(row)} fields, expected {expected}"
+            )
+        yield row, offset
+
+
+def batch_rows(rows, batch_size):
+    """
+    Group rows into lists of at most batch_size rows.
+
+    Args:
+        rows (iterable): (fields, end offset) pairs
+        batch_size (int): Maximum rows per batch
+
+    Yields:
+        tuple: (list of field lists, byte offset just past the last row)
+    """
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield [row for row, _ in batch], batch[-1][1]
+
+
+def buffered(items, maxsize):
+    """
+    Run the upstream stages in a background thread, keeping up to maxsize
+    items ready in a bounded queue.
+
+    File reads, parsing and cleaning then overlap with the downstream load
+    waiting on the network. An exception raised upstream is re-raised in the
+    consumer. With maxsize <= 0 the items are passed through unchanged.
+
+    Args:
+        items (iterable): Upstream stage
+        maxsize (int): Maximum number of items waiting in the queue
+
+    Yields:
+        The upstream items, in order
+    """
+    if maxsize <= 0:
+        yield from items
+        return
+
+    buffer = queue.Queue(maxsize)
+    stopped = threading.Event()
+
+    def put(item):
+        # Give up if the consumer went away, instead of blocking forever
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as error:
+            put(_EndOfStream(error))
+        else:
+            put(_EndOfStream())
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if isinstance(item, _EndOfStream):
+                if item.error is not None:
+                    raise item.error
+                return
+            yield item
+    finally:
+        stopped.set()
+        producer.join()
@@ -11,10 +11,12 @@ Features:
 - Business intelligence query execution
 - Simplified connection string format
 - Direct result display without extensive formatting
+- Optional statement timing and tracing (tracing module)
 
 Dependencies:
 - psycopg2: PostgreSQL adapter for Python
 - python-dotenv: Environment variable loader
+- tracing module: Query timing hooks shared with the class roster project
 
 Usage:
     Requires an existing 'properties' table with sale_price and property_type columns.
@@ -22,9 +24,14 @@ Usage:
 """
 
 import os
+import sys
 import psycopg2
 from dotenv import load_dotenv
 
+# tracing.py is shared by both projects and lives in the repository root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import tracing  # noqa: E402
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -40,7 +47,11 @@ PASSWORD = os.getenv("REAL_ESTATE_PASSWORD")  # Database password
 
 # Establish database connection using connection string format
 # Alternative to keyword argument format: more concise but less explicit
-conn = psycopg2.connect(f"dbname={REAL_ESTATE_DBNAME} user={USER} password={PASSWORD}")
+# connection_factory times every statement when QUERY_TRACE is set
+conn = psycopg2.connect(
+    f"dbname={REAL_ESTATE_DBNAME} user={USER} password={PASSWORD}",
+    connection_factory=tracing.connection_factory(),
+)
 
 # Create cursor for executing database operations
 cur = conn.cursor()
@@ -6,12 +6,14 @@ including CSV file processing, data type conversions, and bulk data insertion.
 It imports real estate property data from a CSV file into a PostgreSQL database.
 
 Features:
-- CSV file reading and processing with DictReader
+- Streaming generator pipeline (read -> parse -> validate -> batch -> clean -> load)
+- CSV file reading and processing in byte ranges and batches
 - Data type conversion and cleaning (strings, integers, decimals, timestamps)
 - Timezone-aware datetime parsing
 - Complex table schema with multiple data types
 - Bulk data insertion with parameterized queries
 - Proper error handling and resource cleanup
+- Optional statement timing and tracing (tracing module)
 
 Dependencies:
 - psycopg2: PostgreSQL adapter for Python
@@ -19,18 +21,52 @@ Dependencies:
 - python-dateutil: Advanced date/time parsing
 - decimal: Precise decimal number handling
 - csv: Built-in CSV file processing
+- tracing module: Query timing hooks shared with the class roster project
 
 Usage:
     Requires a CSV file with real estate data and proper environment configuration.
     Creates and populates a 'properties' table with comprehensive property information.
+
+    python real_estate_import.py
+
+    The stages can also be reused from other code; importing the module has no
+    side effects beyond reading configuration:
+
+    from real_estate_import import connect, extract_transform, load_batches
+    conn = connect()
+    with conn.cursor() as cur:
+        load_batches(cur, extract_transform("data.csv"), table="properties")
+    conn.commit()
 """
 
+import argparse
 import csv
+import hashlib
+import io
 import psycopg2
 import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
+from itertools import chain
 from dotenv import load_dotenv
+from psycopg2.extras import execute_batch, execute_values
 from dateutil import parser, tz
+from pipeline import batch_rows, buffered, parse_rows, read_lines, validate_rows
+from binary_copy import (
+    BinaryCopyBuffer,
+    encode_int4,
+    encode_numeric,
+    encode_text,
+    encode_timestamp,
+)
+
+# tracing.py is shared by both projects and lives in the repository root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import tracing  # noqa: E402
 
 # Load environment variables from .env file
 load_dotenv()
@@ -42,38 +78,184 @@ REAL_ESTATE_DBNAME = os.getenv(
 HOST = os.getenv("HREAL_ESTATE_HOST")  # Database host address
 USER = os.getenv("REAL_ESTATE_USER")  # Database username
 PASSWORD = os.getenv("REAL_ESTATE_PASSWORD")  # Database password
-PORT = int(os.getenv("REAL_ESTATE_PORT"))  # Database port (converted to integer)
+PORT = int(
+    os.getenv("REAL_ESTATE_PORT", "5432")
+)  # Database port (converted to integer)
 PATH_TO_CSV = os.getenv("PATH_TO_CSV")  # File path to the CSV data file
 
+# Load method: "copy" streams rows with text COPY FROM STDIN, "binary" uses binary
+# COPY (no server-side parsing of numbers and dates), "values" and "batch" send
+# multi-row INSERTs through execute_values/execute_batch, "insert" runs one INSERT per row
+LOAD_METHODS = ("copy", "binary", "values", "batch", "insert")
+LOAD_METHOD = os.getenv("REAL_ESTATE_LOAD_METHOD", "copy")
+# Rows sent per statement (values) or per round trip (batch)
+PAGE_SIZE = int(os.getenv("REAL_ESTATE_PAGE_SIZE", "1000"))
+# Number of worker processes (and connections) used to import the CSV in parallel
+WORKERS = int(os.getenv("REAL_ESTATE_WORKERS", "1"))
+# Table the import fills before it is swapped in as properties
+STAGING_TABLE = "properties_staging"
+# Secondary indexes built on the staging table once the data is loaded
+# (property_type is the GROUP BY key of property_analysis.py)
+PROPERTY_INDEXES = ("property_type",)
+# Commit (and checkpoint) every N rows; 0 keeps the whole import in one transaction
+COMMIT_EVERY = int(os.getenv("REAL_ESTATE_COMMIT_EVERY", "0"))
+# Maximum number of distinct sale_date strings kept in the parse cache
+SALE_DATE_CACHE_SIZE = int(os.getenv("REAL_ESTATE_SALE_DATE_CACHE_SIZE", "4096"))
+# CSV rows read and cleaned together by the columnar transform
+TRANSFORM_CHUNK_SIZE = int(os.getenv("REAL_ESTATE_TRANSFORM_CHUNK_SIZE", "10000"))
+# Cleaned batches prepared ahead by a background thread (0 disables the thread)
+PIPELINE_BUFFER = int(os.getenv("REAL_ESTATE_PIPELINE_BUFFER", "2"))
+# Approximate number of bytes handed to the server per COPY read
+COPY_BUFFER_SIZE = int(os.getenv("REAL_ESTATE_COPY_BUFFER_SIZE", "65536"))
+# Leading bytes of a source file hashed into its checkpoint fingerprint
+FINGERPRINT_BYTES = 65536
+
+# Column order shared by every load path (INSERT and COPY)
+PROPERTY_COLUMNS = (
+    "street_address",
+    "city",
+    "zip_code",
+    "state",
+    "number_of_beds",
+    "number_of_baths",
+    "square_feet",
+    "property_type",
+    "sale_date",
+    "sale_price",
+    "latitude",
+    "longitude",
+)
+
+# Binary COPY encoder for each entry of PROPERTY_COLUMNS, matching the table schema
+PROPERTY_BINARY_ENCODERS = (
+    encode_text,  # street_address varchar
+    encode_text,  # city varchar
+    encode_text,  # zip_code varchar
+    encode_text,  # state varchar
+    encode_int4,  # number_of_beds integer
+    encode_int4,  # number_of_baths integer
+    encode_int4,  # square_feet integer
+    encode_text,  # property_type varchar
+    encode_timestamp,  # sale_date timestamp
+    encode_int4,  # sale_price integer
+    encode_numeric,  # latitude decimal
+    encode_numeric,  # longitude decimal
+)
+
 # Timezone configuration for parsing date strings
 # Maps "EDT" timezone abbreviation to proper timezone object
 tzinfos = {"EDT": tz.gettz("America/New_York")}
 
+# Layout of sale_date in the CSV export once the timezone name is removed,
+# e.g. "Wed May 21 00:00:00 EDT 2008" -> "Wed May 21 00:00:00 2008"
+SALE_DATE_FORMAT = "%a %b %d %H:%M:%S %Y"
 
-def table_creation_query():
+
+def table_creation_query(table="properties", unlogged=False, primary_key=True):
     """
     Generate SQL CREATE TABLE statement for properties table.
 
+    Args:
+        table (str): Name of the table to create
+        unlogged (bool): Create an UNLOGGED table (no WAL, truncated after a
+                         crash), used for intermediate load tables
+        primary_key (bool): Declare the primary key now; staging tables skip it
+                            so the index is built once after loading
+
     Returns:
         str: Complete SQL CREATE TABLE statement with comprehensive schema
              including various data types (varchar, integer, decimal, timestamp)
              and a serial primary key for unique identification.
     """
-    return """
-    CREATE TABLE IF NOT EXISTS properties 
-    (id serial PRIMARY KEY, street_address varchar, city varchar, zip_code varchar, state varchar, 
+    return f"""
+    CREATE {"UNLOGGED " if unlogged else ""}TABLE IF NOT EXISTS {table} 
+    (id serial{" PRIMARY KEY" if primary_key else ""}, street_address varchar, city varchar, zip_code varchar, state varchar, 
     number_of_beds integer, number_of_baths integer, square_feet integer, property_type varchar, 
     sale_date timestamp, sale_price integer, latitude decimal, longitude decimal);
 """
 
 
+def checkpoint_table_query():
+    """
+    Generate SQL CREATE TABLE statement for the import checkpoint control table.
+
+    Returns:
+        str: CREATE TABLE statement; one row per source file records the byte
+             offset just past the last committed row, the rows loaded so far
+             and the file's fingerprint (size, mtime and hash of its first
+             bytes). The ALTERs add the fingerprint to older tables.
+    """
+    return """
+    CREATE TABLE IF NOT EXISTS import_checkpoints 
+    (source_path varchar PRIMARY KEY, byte_offset bigint NOT NULL, rows_loaded bigint NOT NULL, 
+    updated_at timestamptz NOT NULL DEFAULT now());
+    ALTER TABLE import_checkpoints ADD COLUMN IF NOT EXISTS file_size bigint;
+    ALTER TABLE import_checkpoints ADD COLUMN IF NOT EXISTS file_mtime_ns bigint;
+    ALTER TABLE import_checkpoints ADD COLUMN IF NOT EXISTS head_sha256 varchar;
+"""
+
+
+def connect():
+    """
+    Open a new connection to the real estate database.
+
+    Returns:
+        psycopg2.extensions.connection: Connection configured from environment variables
+    """
+    return psycopg2.connect(
+        dbname=REAL_ESTATE_DBNAME,
+        user=USER,
+        password=PASSWORD,
+        port=PORT,
+        host=HOST,
+        # Times every statement when QUERY_TRACE is set
+        connection_factory=tracing.connection_factory(),
+    )
+
+
+@lru_cache(maxsize=SALE_DATE_CACHE_SIZE)
+def parse_sale_date(raw):
+    """
+    Parse a sale_date string into a naive wall-clock datetime, with memoization.
+
+    Sale dates repeat heavily across rows (a feed usually covers a handful of
+    days), so results are kept in a bounded LRU cache keyed by the raw string.
+    On a cache miss the fixed CSV layout is tried first with strptime, and only
+    strings that do not match it are handed to the much slower dateutil parser.
+
+    sale_date is a timestamp (without time zone) column. The time zone is only
+    used to validate the string and the wall-clock time from the CSV is kept,
+    so every load method stores the same value whatever the session TimeZone
+    (psycopg2 would send an aware datetime as timestamptz, which the server
+    converts to the session TimeZone, while COPY drops the offset).
+
+    Args:
+        raw (str): Date string from the CSV, e.g. "Wed May 21 00:00:00 EDT 2008"
+
+    Returns:
+        datetime: Parsed datetime without tzinfo
+    """
+    parts = raw.split()
+    if len(parts) == 6 and parts[4] in tzinfos:
+        try:
+            parsed = datetime.strptime(
+                " ".join(parts[:4] + parts[5:]), SALE_DATE_FORMAT
+            )
+        except ValueError:
+            pass
+        else:
+            return parsed
+    # Fall back to dateutil for any other layout
+    return parser.parse(raw, tzinfos=tzinfos).replace(tzinfo=None)
+
+
 def clean_data(csv_row):
     """
     Clean and transform CSV row data into database-ready format.
 
     Performs data type conversions and field mapping from CSV column names
     to database column names. Handles string-to-integer conversions,
-    date parsing with timezone awareness, and decimal precision for coordinates.
+    date parsing to wall-clock datetimes, and decimal precision for coordinates.
 
     Args:
         csv_row (dict): Raw CSV row data as dictionary with original column names
@@ -82,7 +264,7 @@ def clean_data(csv_row):
         dict: Cleaned data with proper data types and database-compatible field names
               - Strings remain as strings for address fields
               - Numeric strings converted to integers for beds, baths, square_feet
-              - Date strings parsed to timezone-aware datetime objects
+              - Date strings parsed to naive (wall-clock) datetime objects
               - Coordinate strings converted to high-precision Decimal objects
     """
     cleaned = {}
@@ -96,8 +278,8 @@ def clean_data(csv_row):
     cleaned["number_of_baths"] = int(csv_row["baths"])
     cleaned["square_feet"] = int(csv_row["sq__ft"])
     cleaned["property_type"] = csv_row["type"]
-    # Parse date string with timezone information into datetime object
-    cleaned["sale_date"] = parser.parse(csv_row["sale_date"], tzinfos=tzinfos)
+    # Parse date string into a wall-clock datetime object
+    cleaned["sale_date"] = parse_sale_date(csv_row["sale_date"])
     cleaned["sale_price"] = csv_row["price"]
     # Convert coordinate strings to Decimal for precise geographic positioning
     cleaned["latitude"] = Decimal(csv_row["latitude"])
@@ -105,83 +287,901 @@ def clean_data(csv_row):
     return cleaned
 
 
-try:
-    # Establish database connection using environment variables
-    conn = psycopg2.connect(
-        dbname=REAL_ESTATE_DBNAME, user=USER, password=PASSWORD, port=PORT, host=HOST
-    )
+def clean_columns(raw_rows, fieldnames):
+    """
+    Clean a chunk of CSV rows column by column (columnar counterpart of clean_data).
 
-    # Create cursor for executing database operations
-    cur = conn.cursor()
+    The chunk is transposed once into per-column sequences and every column is
+    converted in a single pass, instead of building a 12-key dictionary per
+    row. Integer columns are stored in compact array('i') buffers, which also
+    rejects values that do not fit the integer (int4) database columns.
+
+    Args:
+        raw_rows (list): CSV rows as lists of strings (csv.reader output)
+        fieldnames (list): Column names from the CSV header
+
+    Returns:
+        dict: Database column name -> sequence of cleaned values, with the
+              same types clean_data() produces (sale_price becomes an int)
+    """
+    if not raw_rows:
+        return {column: [] for column in PROPERTY_COLUMNS}
+    raw = dict(zip(fieldnames, zip(*raw_rows)))
+    return {
+        # Map CSV column names to database field names
+        "street_address": raw["street"],
+        "city": raw["city"],
+        "zip_code": raw["zip"],
+        "state": raw["state"],
+        # Convert whole numeric columns at once into 32-bit integer arrays
+        "number_of_beds": array("i", map(int, raw["beds"])),
+        "number_of_baths": array("i", map(int, raw["baths"])),
+        "square_feet": array("i", map(int, raw["sq__ft"])),
+        "property_type": raw["type"],
+        # Few distinct dates per chunk, so this is mostly parse_sale_date cache hits
+        "sale_date": list(map(parse_sale_date, raw["sale_date"])),
+        "sale_price": array("i", map(int, raw["price"])),
+        # Decimal keeps coordinates exact for the numeric columns
+        "latitude": list(map(Decimal, raw["latitude"])),
+        "longitude": list(map(Decimal, raw["longitude"])),
+    }
+
+
+def column_rows(columns):
+    """
+    Zip cleaned columns back into row tuples ordered like PROPERTY_COLUMNS.
+
+    Args:
+        columns (dict): Output of clean_columns()
+
+    Returns:
+        iterator: Row tuples for the INSERT and binary COPY load methods
+    """
+    return zip(*(columns[column] for column in PROPERTY_COLUMNS))
+
+
+def insert_query(table="properties", multi_row=False):
+    """
+    Generate the parameterized INSERT statement for the properties columns.
+
+    Args:
+        table (str): Target table name
+        multi_row (bool): Use a single %s for the whole VALUES list, as
+                          expected by psycopg2.extras.execute_values()
+
+    Returns:
+        str: INSERT statement with %s placeholders
+    """
+    if multi_row:
+        values = "%s"
+    else:
+        values = "(" + ", ".join(["%s"] * len(PROPERTY_COLUMNS)) + ")"
+    return f"INSERT INTO {table} ({', '.join(PROPERTY_COLUMNS)}) VALUES {values}"
+
+
+def property_row(cleaned):
+    """
+    Convert a cleaned row dictionary into a tuple ordered like PROPERTY_COLUMNS.
+
+    Args:
+        cleaned (dict): Output of clean_data()
+
+    Returns:
+        tuple: Column values in the order expected by the load statements
+    """
+    return tuple(cleaned[column] for column in PROPERTY_COLUMNS)
 
-    # Drop existing properties table for clean import (removes old data)
-    cur.execute("DROP TABLE IF EXISTS properties")
 
-    # Create new properties table with comprehensive schema
-    cur.execute(table_creation_query())
-
-    # Open and process CSV file using context manager (automatic file closure)
-    with open(PATH_TO_CSV, mode="r") as csv_file:
-        # DictReader treats first row as headers, returns each row as dictionary
-        csv_reader = csv.DictReader(csv_file)
-
-        # Process each row in the CSV file
-        for row in csv_reader:
-            # Clean and convert data types for database insertion
-            cleaned_data = clean_data(row)
-
-            # Execute parameterized INSERT query to prevent SQL injection
-            # Uses %s placeholders for all 12 data fields
-            cur.execute(
-                """
-                    INSERT INTO properties (
-                        street_address,
-                        city,
-                        zip_code,
-                        state,
-                        number_of_beds,
-                        number_of_baths,
-                        square_feet,
-                        property_type,
-                        sale_date,
-                        sale_price,
-                        latitude,
-                        longitude
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """,
+# Escapes for characters that would otherwise break a text COPY line
+COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def copy_text_value(value):
+    """
+    Encode a single value for PostgreSQL's text COPY format.
+
+    NULL is written as \\N, datetimes in ISO format, and backslash, tab,
+    newline and carriage return are escaped so they cannot break the row.
+
+    Note: parse_sale_date() returns naive datetimes, so sale_date is written
+    without an offset and stores the same wall-clock time as the INSERT paths.
+
+    Args:
+        value: Python value produced by clean_data()
+
+    Returns:
+        str: The escaped text representation of the value
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    return str(value).translate(COPY_ESCAPES)
+
+
+def copy_text_lines(rows):
+    """
+    Encode row tuples into text COPY lines, one at a time.
+
+    Args:
+        rows (iterable): Row tuples ordered like PROPERTY_COLUMNS
+
+    Yields:
+        str: One tab-separated, newline-terminated line per row
+    """
+    for row in rows:
+        yield "\t".join(copy_text_value(value) for value in row) + "\n"
+
+
+def column_copy_text(columns):
+    """
+    Encode a chunk of cleaned columns into a block of text COPY lines.
+
+    Each column is converted to text in one pass (integer arrays need no
+    escaping) and the columns are then zipped into tab-separated lines.
+
+    Args:
+        columns (dict): Output of clean_columns()
+
+    Returns:
+        str: Newline-terminated COPY lines for every row of the chunk
+    """
+    encoded = []
+    for column in PROPERTY_COLUMNS:
+        values = columns[column]
+        first = values[0] if len(values) else None
+        if isinstance(values, array) or isinstance(first, Decimal):
+            # Numbers never contain characters that need escaping
+            encoded.append(map(str, values))
+        elif isinstance(first, datetime):
+            # Format each distinct timestamp once per chunk
+            formatted = {value: copy_text_value(value) for value in set(values)}
+            encoded.append(map(formatted.__getitem__, values))
+        else:
+            encoded.append(
                 (
-                    # Pass cleaned data as tuple in exact order matching INSERT columns
-                    cleaned_data["street_address"],
-                    cleaned_data["city"],
-                    cleaned_data["zip_code"],
-                    cleaned_data["state"],
-                    cleaned_data["number_of_beds"],
-                    cleaned_data["number_of_baths"],
-                    cleaned_data["square_feet"],
-                    cleaned_data["property_type"],
-                    cleaned_data["sale_date"],
-                    cleaned_data["sale_price"],
-                    cleaned_data["latitude"],
-                    cleaned_data["longitude"],
-                ),
+                    copy_text_value(value)
+                    if value is None
+                    else value.translate(COPY_ESCAPES)
+                )
+                for value in values
             )
+    lines = "\n".join(map("\t".join, zip(*encoded)))
+    return lines + "\n" if lines else ""
+
+
+class CopyBuffer(io.TextIOBase):
+    """
+    File-like object that feeds COPY FROM STDIN from an iterator of text blocks.
+
+    cursor.copy_expert() calls read() repeatedly; each call pulls just enough
+    blocks to fill the requested size, so memory stays bounded no matter how
+    large the CSV file is and the whole load runs as a single COPY statement.
+    """
+
+    def __init__(self, blocks):
+        """
+        Args:
+            blocks (iterable): Encoded COPY text, each block holding whole lines
+                               (see copy_text_lines() and column_copy_text())
+        """
+        self.blocks = iter(blocks)
+        self.pending = ""  # Encoded text not yet handed to the server
+        self.row_count = 0  # Number of rows encoded so far
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        """
+        Return up to size characters of COPY text (everything if size < 0).
+        """
+        chunks = [self.pending]
+        buffered = len(self.pending)
+        while size < 0 or buffered < size:
+            block = next(self.blocks, None)
+            if block is None:
+                break
+            chunks.append(block)
+            buffered += len(block)
+            # Newlines inside values are escaped, so each one ends a row
+            self.row_count += block.count("\n")
+        data = "".join(chunks)
+        if size < 0:
+            self.pending = ""
+            return data
+        self.pending = data[size:]
+        return data[:size]
+
+
+def copy_rows(cur, rows, table="properties", binary=False):
+    """
+    Bulk-load row tuples into a table with COPY FROM STDIN.
+
+    Args:
+        cur: Open psycopg2 cursor
+        rows (iterable): Row tuples ordered like PROPERTY_COLUMNS
+        table (str): Target table name
+        binary (bool): Use PostgreSQL's binary COPY format instead of text
+
+    Returns:
+        int: Number of rows copied
+    """
+    statement = f"COPY {table} ({', '.join(PROPERTY_COLUMNS)}) FROM STDIN"
+    if binary:
+        buffer = BinaryCopyBuffer(rows, PROPERTY_BINARY_ENCODERS)
+        statement += " WITH (FORMAT binary)"
+    else:
+        buffer = CopyBuffer(copy_text_lines(rows))
+    cur.copy_expert(statement, buffer, size=COPY_BUFFER_SIZE)
+    return buffer.row_count
+
+
+def copy_column_chunks(cur, column_chunks, table="properties"):
+    """
+    Bulk-load cleaned column chunks with text COPY, one text block per chunk.
 
-    # Commit all INSERT operations to make changes permanent
+    Args:
+        cur: Open psycopg2 cursor
+        column_chunks (iterable): Outputs of clean_columns()
+        table (str): Target table name
+
+    Returns:
+        int: Number of rows copied
+    """
+    buffer = CopyBuffer(map(column_copy_text, column_chunks))
+    cur.copy_expert(
+        f"COPY {table} ({', '.join(PROPERTY_COLUMNS)}) FROM STDIN",
+        buffer,
+        size=COPY_BUFFER_SIZE,
+    )
+    return buffer.row_count
+
+
+def insert_rows(cur, rows, table="properties", method="insert", page_size=PAGE_SIZE):
+    """
+    Load row tuples with INSERT statements.
+
+    Args:
+        cur: Open psycopg2 cursor
+        rows (iterable): Row tuples ordered like PROPERTY_COLUMNS
+        table (str): Target table name
+        method (str): "values" sends page_size rows per INSERT statement,
+                      "batch" sends page_size single-row INSERTs per round trip,
+                      "insert" executes one INSERT per row
+        page_size (int): Rows grouped per page for "values" and "batch"
+    """
+    if method == "values":
+        execute_values(
+            cur, insert_query(table, multi_row=True), rows, page_size=page_size
+        )
+    elif method == "batch":
+        execute_batch(cur, insert_query(table), rows, page_size=page_size)
+    else:
+        # Execute parameterized INSERT query to prevent SQL injection
+        query = insert_query(table)
+        for row in rows:
+            cur.execute(query, row)
+
+
+def load_rows(cur, rows, table="properties", method=LOAD_METHOD, page_size=PAGE_SIZE):
+    """
+    Load row tuples into a table with the selected load method.
+
+    Args:
+        cur: Open psycopg2 cursor
+        rows (iterable): Row tuples ordered like PROPERTY_COLUMNS
+        table (str): Target table name
+        method (str): One of LOAD_METHODS
+        page_size (int): Rows grouped per page for the "values" and "batch" methods
+    """
+    if method in ("copy", "binary"):
+        copy_rows(cur, rows, table, binary=method == "binary")
+    else:
+        insert_rows(cur, rows, table, method, page_size)
+
+
+def read_csv_header(path):
+    """
+    Read the column names from the first line of a CSV file.
+
+    Args:
+        path (str): Path to the CSV file
+
+    Returns:
+        tuple: (list of column names, byte offset where the data rows start)
+    """
+    with open(path, mode="rb") as csv_file:
+        header = csv_file.readline()
+        return next(csv.reader([header.decode("utf-8")])), csv_file.tell()
+
+
+def partition_csv(path, partitions):
+    """
+    Split the data rows of a CSV file into byte ranges aligned on line boundaries.
+
+    Each range starts at the beginning of a line and ends at the beginning of
+    the next range, so every row belongs to exactly one partition. Rows must
+    not contain quoted line breaks (true for the real estate export).
+
+    Args:
+        path (str): Path to the CSV file
+        partitions (int): Desired number of ranges (fewer are returned for small files)
+
+    Returns:
+        list: (start, end) byte offsets, one per partition
+    """
+    _, data_start = read_csv_header(path)
+    size = os.path.getsize(path)
+    bounds = [data_start]
+    with open(path, mode="rb") as csv_file:
+        for index in range(1, partitions):
+            target = data_start + (size - data_start) * index // partitions
+            # Step back one byte and finish the current line, so a target that
+            # already sits on a line start is kept as is
+            csv_file.seek(max(target - 1, bounds[-1]))
+            csv_file.readline()
+            boundary = csv_file.tell()
+            if boundary >= size:
+                break
+            if boundary > bounds[-1]:
+                bounds.append(boundary)
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def clean_batches(batches, fieldnames):
+    """
+    Pipeline stage that cleans each batch of raw rows column by column.
+
+    Args:
+        batches (iterable): (list of field lists, end offset) pairs from batch_rows()
+        fieldnames (list): Column names from the CSV header
+
+    Yields:
+        tuple: (columns dict from clean_columns(), row count, end offset)
+    """
+    for rows, offset in batches:
+        yield clean_columns(rows, fieldnames), len(rows), offset
+
+
+def extract_transform(
+    path,
+    start=None,
+    end=None,
+    batch_size=TRANSFORM_CHUNK_SIZE,
+    buffer_size=PIPELINE_BUFFER,
+):
+    """
+    Build the extract and transform half of the import pipeline for a CSV file.
+
+    Chains read_lines -> parse_rows -> validate_rows -> batch_rows ->
+    clean_batches, optionally running them in a background thread behind a
+    bounded queue of buffer_size batches. Nothing is read until the returned
+    iterator is consumed.
+
+    Args:
+        path (str): Path to the CSV file
+        start (int or None): Offset of the first line to read, defaults to the
+                             first data row after the header
+        end (int or None): Offset where reading stops, defaults to end of file
+        batch_size (int): Rows per cleaned batch
+        buffer_size (int): Batches prepared ahead of the loader
+
+    Returns:
+        iterator: (columns dict, row count, end offset) per batch
+    """
+    fieldnames, data_start = read_csv_header(path)
+    if start is None:
+        start = data_start
+    if end is None:
+        end = os.path.getsize(path)
+    rows = validate_rows(parse_rows(read_lines(path, start, end)), fieldnames)
+    batches = clean_batches(batch_rows(rows, batch_size), fieldnames)
+    return buffered(batches, buffer_size)
+
+
+def load_batches(
+    cur, batches, table="properties", method=LOAD_METHOD, page_size=PAGE_SIZE
+):
+    """
+    Load stage: stream cleaned batches into a table with the selected method.
+
+    All batches go through one load operation (a single COPY for the copy
+    methods), so this does not commit; see import_chunked() for per-batch commits.
+
+    Args:
+        cur: Open psycopg2 cursor
+        batches (iterable): (columns dict, row count, end offset) per batch
+        table (str): Target table name
+        method (str): One of LOAD_METHODS
+        page_size (int): Rows grouped per page for the "values" and "batch" methods
+
+    Returns:
+        int: Number of rows loaded
+    """
+    rows_loaded = 0
+
+    def columns():
+        nonlocal rows_loaded
+        for columns, row_count, _ in batches:
+            yield columns
+            rows_loaded += row_count
+
+    load_columns(cur, columns(), table, method, page_size)
+    return rows_loaded
+
+
+def import_csv(conn, path, method=LOAD_METHOD, page_size=PAGE_SIZE):
+    """
+    Import a whole CSV file through the staging table in a single transaction,
+    then swap the staging table in as properties.
+
+    Args:
+        conn: Open psycopg2 connection
+        path (str): Path to the CSV file
+        method (str): One of LOAD_METHODS
+        page_size (int): Rows grouped per page for the "values" and "batch" methods
+
+    Returns:
+        int: Number of rows loaded
+    """
+    with conn.cursor() as cur:
+        # Load into a fresh UNLOGGED staging table, so readers of properties
+        # keep seeing the previous data until the swap
+        create_staging_table(cur)
+        rows_loaded = load_batches(
+            cur, extract_transform(path), STAGING_TABLE, method, page_size
+        )
+    # Commit all loaded rows to make changes permanent
     # Without commit(), all inserts would be rolled back
     conn.commit()
-    print("Table created and data inserted successfully!")
-
-except psycopg2.Error as e:
-    # Handle PostgreSQL-specific errors (connection, SQL syntax, constraint violations)
-    print("Database Error", e)
-except Exception as e:
-    # Handle other errors (file not found, data conversion errors, etc.)
-    print("Unexpected Error", e)
-
-finally:
-    # Ensure proper cleanup of database resources
-    # Closes cursor and connection even if errors occurred
-    if cur is not None:
-        cur.close()
-    if conn is not None:
+
+    # Build indexes once over the loaded data, then swap the table in
+    publish_staging_table(conn)
+    return rows_loaded
+
+
+def create_staging_table(cur):
+    """
+    Recreate the empty UNLOGGED staging table, without any index.
+
+    Args:
+        cur: Open psycopg2 cursor
+    """
+    cur.execute(f"DROP TABLE IF EXISTS {STAGING_TABLE}")
+    cur.execute(table_creation_query(STAGING_TABLE, unlogged=True, primary_key=False))
+
+
+def build_staging_indexes(cur):
+    """
+    Prepare the loaded staging table for readers.
+
+    The table is switched to LOGGED so it survives a crash once it replaces
+    properties, then the primary key and secondary indexes are built in one
+    pass each and planner statistics are collected.
+
+    Safe to run again on a table it already prepared (e.g. a --resume after
+    the swap failed): SET LOGGED is a no-op on a logged table, and existing
+    constraints and indexes are kept.
+
+    Args:
+        cur: Open psycopg2 cursor
+    """
+    cur.execute(f"ALTER TABLE {STAGING_TABLE} SET LOGGED")
+    cur.execute(
+        "SELECT 1 FROM pg_constraint WHERE conrelid = %s::regclass AND conname = %s",
+        (STAGING_TABLE, f"{STAGING_TABLE}_pkey"),
+    )
+    if cur.fetchone() is None:
+        cur.execute(
+            f"ALTER TABLE {STAGING_TABLE} "
+            f"ADD CONSTRAINT {STAGING_TABLE}_pkey PRIMARY KEY (id)"
+        )
+    for column in PROPERTY_INDEXES:
+        cur.execute(
+            f"CREATE INDEX IF NOT EXISTS {STAGING_TABLE}_{column}_idx "
+            f"ON {STAGING_TABLE} ({column})"
+        )
+    cur.execute(f"ANALYZE {STAGING_TABLE}")
+
+
+def swap_staging_table(cur):
+    """
+    Replace properties with the staging table by renaming it.
+
+    Run this in its own short transaction: readers keep using the old table
+    until commit and then see the complete new one, never a missing or
+    half-filled table. The index, constraint and sequence names are renamed
+    too, so the next import can reuse the staging names.
+
+    Args:
+        cur: Open psycopg2 cursor
+    """
+    cur.execute("DROP TABLE IF EXISTS properties")
+    cur.execute(f"ALTER TABLE {STAGING_TABLE} RENAME TO properties")
+    cur.execute(
+        f"ALTER TABLE properties RENAME CONSTRAINT {STAGING_TABLE}_pkey TO properties_pkey"
+    )
+    for column in PROPERTY_INDEXES:
+        cur.execute(
+            f"ALTER INDEX {STAGING_TABLE}_{column}_idx RENAME TO properties_{column}_idx"
+        )
+    cur.execute(f"ALTER SEQUENCE {STAGING_TABLE}_id_seq RENAME TO properties_id_seq")
+
+
+def publish_staging_table(conn):
+    """
+    Index the committed staging table and swap it in as properties.
+
+    Args:
+        conn: Open psycopg2 connection with no pending changes
+    """
+    with conn.cursor() as cur:
+        build_staging_indexes(cur)
+        conn.commit()
+        swap_staging_table(cur)
+        conn.commit()
+
+
+def import_partition(task):
+    """
+    Clean and load one byte range of the CSV file over its own connection.
+
+    Runs inside a worker process. Rows are appended to the shared staging
+    table and committed independently; nothing is visible to readers until
+    the staging table is swapped in after every worker has finished.
+
+    Args:
+        task (tuple): (partition index, start offset, end offset, csv path,
+                      load method, page size)
+
+    Returns:
+        tuple: (partition index, so the caller can log progress, and the
+               worker's tracing measurements for the parent to merge)
+    """
+    index, start, end, path, method, page_size = task
+    conn = connect()
+    try:
+        with conn.cursor() as cur:
+            batches = extract_transform(path, start, end)
+            load_batches(cur, batches, STAGING_TABLE, method, page_size)
+        conn.commit()
+    finally:
         conn.close()
+    return index, tracing.take_metrics()
+
+
+def import_parallel(conn, path, workers, method=LOAD_METHOD, page_size=PAGE_SIZE):
+    """
+    Import a CSV file with a pool of worker processes, one connection each.
+
+    The file is split into line-aligned byte ranges and each worker parses,
+    cleans and loads its range into the staging table. The final step indexes
+    the staging table and swaps it in as properties in one short transaction.
+    Ids are assigned as rows arrive, so they interleave across partitions.
+
+    Args:
+        conn: Open psycopg2 connection used to prepare and publish the table
+        path (str): Path to the CSV file
+        workers (int): Number of worker processes
+        method (str): Load method used by the workers
+        page_size (int): Rows per page for the "values" and "batch" methods
+    """
+    with conn.cursor() as cur:
+        create_staging_table(cur)
+    conn.commit()
+
+    ranges = partition_csv(path, workers)
+    tasks = [
+        (index, start, end, path, method, page_size)
+        for index, (start, end) in enumerate(ranges)
+    ]
+    # Workers hand their query metrics back, so the parent reports the totals
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=tracing.report_to_parent
+    ) as pool:
+        for index, metrics in pool.map(import_partition, tasks):
+            tracing.merge_metrics(metrics)
+            print(f"Partition {index + 1}/{len(tasks)} loaded")
+
+    publish_staging_table(conn)
+
+
+def source_fingerprint(path):
+    """
+    Identify the current contents of a source file.
+
+    A file replaced or appended to since a checkpoint was taken changes size,
+    modification time or leading bytes, so its byte offsets no longer apply.
+
+    Args:
+        path (str): Path of the CSV file
+
+    Returns:
+        tuple: (size in bytes, mtime in nanoseconds, SHA-256 hex digest of the
+               first FINGERPRINT_BYTES bytes)
+    """
+    stat = os.stat(path)
+    with open(path, "rb") as source:
+        head_sha256 = hashlib.sha256(source.read(FINGERPRINT_BYTES)).hexdigest()
+    return stat.st_size, stat.st_mtime_ns, head_sha256
+
+
+def load_checkpoint(cur, path):
+    """
+    Fetch the last committed checkpoint for a source file.
+
+    Args:
+        cur: Open psycopg2 cursor
+        path (str): Absolute path of the CSV file
+
+    Returns:
+        tuple or None: (byte offset, rows loaded, fingerprint), or None if no
+                       checkpoint exists; the fingerprint has the layout of
+                       source_fingerprint() (NULLs for older checkpoints)
+    """
+    cur.execute(
+        """
+        SELECT byte_offset, rows_loaded, file_size, file_mtime_ns, head_sha256
+        FROM import_checkpoints WHERE source_path = %s
+        """,
+        (path,),
+    )
+    row = cur.fetchone()
+    if row is None:
+        return None
+    return row[0], row[1], tuple(row[2:])
+
+
+def save_checkpoint(cur, path, offset, rows_loaded, fingerprint):
+    """
+    Record how far the import of a source file has progressed.
+
+    Must run in the same transaction as the rows it covers, so the checkpoint
+    and the data are committed (or rolled back) together.
+
+    Args:
+        cur: Open psycopg2 cursor
+        path (str): Absolute path of the CSV file
+        offset (int): Byte offset just past the last loaded row
+        rows_loaded (int): Total rows loaded so far
+        fingerprint (tuple): source_fingerprint() of the file being imported
+    """
+    cur.execute(
+        """
+        INSERT INTO import_checkpoints
+        (source_path, byte_offset, rows_loaded, file_size, file_mtime_ns, head_sha256)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        ON CONFLICT (source_path) DO UPDATE
+        SET byte_offset = EXCLUDED.byte_offset,
+            rows_loaded = EXCLUDED.rows_loaded,
+            file_size = EXCLUDED.file_size,
+            file_mtime_ns = EXCLUDED.file_mtime_ns,
+            head_sha256 = EXCLUDED.head_sha256,
+            updated_at = now()
+        """,
+        (path, offset, rows_loaded, *fingerprint),
+    )
+
+
+def staging_table_matches(cur, rows_loaded):
+    """
+    Check that the staging table exists and holds the checkpointed row count.
+
+    Args:
+        cur: Open psycopg2 cursor
+        rows_loaded (int): Row count recorded in the checkpoint
+
+    Returns:
+        bool: True if resuming into the staging table is safe
+    """
+    cur.execute("SELECT to_regclass(%s)", (STAGING_TABLE,))
+    if cur.fetchone()[0] is None:
+        return False
+    cur.execute(f"SELECT count(*) FROM {STAGING_TABLE}")
+    return cur.fetchone()[0] == rows_loaded
+
+
+def import_chunked(
+    conn, path, commit_every, resume=False, method=LOAD_METHOD, page_size=PAGE_SIZE
+):
+    """
+    Import a CSV file committing every commit_every rows, with resumable checkpoints.
+
+    Each chunk of rows is loaded into the staging table together with an
+    updated checkpoint row and committed, so a failure only loses the chunk in
+    flight. When resume is set and a checkpoint exists, the staging table is
+    kept and reading continues from the recorded byte offset; otherwise the
+    staging table is recreated. Resuming is refused if the file's fingerprint
+    no longer matches the checkpoint's (the file was replaced or appended to),
+    since the offset would then point into different data. After the last chunk the staging table is
+    swapped in as properties and the checkpoint is removed.
+
+    Args:
+        conn: Open psycopg2 connection
+        path (str): Path to the CSV file
+        commit_every (int): Rows per committed chunk
+        resume (bool): Continue from the last checkpoint instead of starting over
+        method (str): Load method used for each chunk
+        page_size (int): Rows per page for the "values" and "batch" methods
+
+    Returns:
+        int: Total rows loaded for this file, including resumed chunks
+
+    Raises:
+        ValueError: If resume is set and the file changed since the checkpoint
+    """
+    path = os.path.abspath(path)
+    _, data_start = read_csv_header(path)
+    fingerprint = source_fingerprint(path)
+    with conn.cursor() as cur:
+        cur.execute(checkpoint_table_query())
+        checkpoint = load_checkpoint(cur, path) if resume else None
+        if checkpoint is not None and checkpoint[2] != fingerprint:
+            conn.rollback()
+            raise ValueError(
+                f"{path} changed since its checkpoint was taken (size, mtime or "
+                "leading bytes differ); run without --resume to start over"
+            )
+        if checkpoint is not None and not staging_table_matches(cur, checkpoint[1]):
+            # An UNLOGGED table is emptied by a server crash, so the checkpoint
+            # can only be trusted if the staging rows are still there
+            print("Staging table does not match the checkpoint, starting over")
+            checkpoint = None
+        if checkpoint is None:
+            create_staging_table(cur)
+            offset, rows_loaded = data_start, 0
+            save_checkpoint(cur, path, offset, rows_loaded, fingerprint)
+        else:
+            offset, rows_loaded, _ = checkpoint
+            print(f"Resuming after {rows_loaded} rows (byte offset {offset})")
+        conn.commit()
+
+        batches = extract_transform(path, offset, batch_size=commit_every)
+        for columns, row_count, offset in batches:
+            load_columns(cur, [columns], STAGING_TABLE, method, page_size)
+            rows_loaded += row_count
+            save_checkpoint(cur, path, offset, rows_loaded, fingerprint)
+            conn.commit()
+
+        build_staging_indexes(cur)
+        conn.commit()
+        # The finished import no longer needs its checkpoint
+        swap_staging_table(cur)
+        cur.execute("DELETE FROM import_checkpoints WHERE source_path = %s", (path,))
+        conn.commit()
+    return rows_loaded
+
+
+def load_columns(
+    cur, column_chunks, table="properties", method=LOAD_METHOD, page_size=PAGE_SIZE
+):
+    """
+    Load cleaned column chunks into a table with the selected load method.
+
+    Text COPY is encoded straight from the columns; the other methods consume
+    the chunks as row tuples.
+
+    Args:
+        cur: Open psycopg2 cursor
+        column_chunks (iterable): Outputs of clean_columns()
+        table (str): Target table name
+        method (str): One of LOAD_METHODS
+        page_size (int): Rows grouped per page for the "values" and "batch" methods
+    """
+    if method == "copy":
+        copy_column_chunks(cur, column_chunks, table)
+    else:
+        rows = chain.from_iterable(map(column_rows, column_chunks))
+        load_rows(cur, rows, table, method, page_size)
+
+
+def parse_args(argv=None):
+    """
+    Parse command-line options, using the environment for defaults.
+
+    Args:
+        argv (list or None): Arguments to parse, defaults to sys.argv
+
+    Returns:
+        argparse.Namespace: Parsed options
+    """
+    arg_parser = argparse.ArgumentParser(
+        description="Import real estate CSV data into PostgreSQL."
+    )
+    arg_parser.add_argument(
+        "--load-method",
+        choices=LOAD_METHODS,
+        default=LOAD_METHOD,
+        help="How rows are written (default: REAL_ESTATE_LOAD_METHOD or copy)",
+    )
+    arg_parser.add_argument(
+        "--page-size",
+        type=int,
+        default=PAGE_SIZE,
+        help="Rows per page for the values and batch methods "
+        "(default: REAL_ESTATE_PAGE_SIZE or 1000)",
+    )
+    arg_parser.add_argument(
+        "--workers",
+        type=int,
+        default=WORKERS,
+        help="Worker processes importing byte ranges of the CSV in parallel "
+        "(default: REAL_ESTATE_WORKERS or 1)",
+    )
+    arg_parser.add_argument(
+        "--commit-every",
+        type=int,
+        default=COMMIT_EVERY,
+        help="Commit and checkpoint every N rows, 0 for a single transaction "
+        "(default: REAL_ESTATE_COMMIT_EVERY or 0)",
+    )
+    arg_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue from the last committed checkpoint instead of starting over",
+    )
+    args = arg_parser.parse_args(argv)
+    if args.resume and args.commit_every <= 0:
+        arg_parser.error("--resume requires --commit-every")
+    if args.commit_every > 0 and args.workers > 1:
+        arg_parser.error("--commit-every cannot be combined with --workers")
+    return args
+
+
+def main(argv=None):
+    """
+    Import the CSV file into a staging table and swap it in as properties.
+
+    Args:
+        argv (list or None): Command-line arguments, defaults to sys.argv
+    """
+    args = parse_args(argv)
+    conn = None
+    try:
+        # Establish database connection using environment variables
+        conn = connect()
+
+        if args.workers > 1:
+            # Workers load partitions over their own connections, then the
+            # staging table is swapped in as properties in one transaction
+            import_parallel(
+                conn, PATH_TO_CSV, args.workers, args.load_method, args.page_size
+            )
+            print("Table created and data inserted successfully!")
+            return
+
+        if args.commit_every > 0:
+            # Commit in chunks, recording a checkpoint with every chunk
+            rows_loaded = import_chunked(
+                conn,
+                PATH_TO_CSV,
+                args.commit_every,
+                args.resume,
+                args.load_method,
+                args.page_size,
+            )
+            print(f"Table created and {rows_loaded} rows inserted successfully!")
+            return
+
+        # Stream the whole file through the pipeline in one transaction
+        rows_loaded = import_csv(conn, PATH_TO_CSV, args.load_method, args.page_size)
+        print(f"Table created and {rows_loaded} rows inserted successfully!")
+
+    except psycopg2.Error as e:
+        # Handle PostgreSQL-specific errors (connection, SQL syntax, constraint violations)
+        print("Database Error", e)
+    except Exception as e:
+        # Handle other errors (file not found, data conversion errors, etc.)
+        print("Unexpected Error", e)
+
+    finally:
+        # Ensure proper cleanup of database resources
+        # Closes the connection even if errors occurred
+        if conn is not None:
+            conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,614 @@
+"""
+Query Timing and Tracing Hooks
+
+This module provides a small instrumentation layer shared by the class roster
+and real estate scripts. Connections opened with TracingConnection create
+TracingCursor cursors, which time every statement they run and report the
+wall time, rows affected or returned, and bytes sent to the configured sinks.
+db.py additionally reports how long each checkout waited for a pooled
+connection.
+
+Tracing is off unless QUERY_TRACE names at least one sink; connections are
+then opened with the standard psycopg2 classes and nothing is measured.
+
+Sinks (comma-separated in QUERY_TRACE):
+- log: one line per statement on stderr
+- histogram: in-memory latency histograms, read with tracer.snapshot()
+- prometheus: the histograms written to a Prometheus node_exporter textfile
+  (QUERY_TRACE_TEXTFILE), refreshed every QUERY_TRACE_FLUSH seconds and at exit
+
+Worker processes do not write the textfile. A process pool started with
+initializer=report_to_parent returns each task's take_metrics() to the parent,
+which adds them up with merge_metrics(), so one program writes one file with
+the totals of all its processes. Forked processes start with empty
+measurements, so the parent's are never counted twice.
+
+Dependencies:
+- psycopg2: PostgreSQL adapter for Python
+
+Usage:
+    import tracing
+    conn = psycopg2.connect(..., connection_factory=tracing.connection_factory())
+
+    QUERY_TRACE=log,prometheus QUERY_TRACE_TEXTFILE=/var/lib/node_exporter/psycopg2.prom \\
+        python real_estate_import.py
+"""
+
+import atexit
+import os
+import re
+import sys
+import threading
+import time
+from bisect import bisect_left
+from psycopg2 import extensions
+
+# Sinks to enable, e.g. "log,histogram"; empty disables tracing
+QUERY_TRACE = os.getenv("QUERY_TRACE", "")
+# Prometheus textfile path, normally inside the node_exporter textfile
+# collector directory (relative paths are resolved against the working directory)
+QUERY_TRACE_TEXTFILE = os.getenv("QUERY_TRACE_TEXTFILE", "query_trace.prom")
+# Minimum seconds between two rewrites of the Prometheus textfile
+QUERY_TRACE_FLUSH = float(os.getenv("QUERY_TRACE_FLUSH", "10"))
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+    2.5, 5.0, 10.0, 30.0, 60.0,
+)  # fmt: skip
+# Statement keywords followed by a name worth keeping in the label
+NAMED_STATEMENTS = ("PREPARE", "EXECUTE", "COPY")
+
+
+def statement_label(query):
+    """
+    Reduce a statement to a short label used to group measurements.
+
+    The first keyword is kept, plus the statement or table name for PREPARE,
+    EXECUTE and COPY; literal values never end up in labels.
+
+    Args:
+        query (str or bytes): SQL statement
+
+    Returns:
+        str: Label such as "SELECT" or "EXECUTE student_lookup"
+    """
+    if isinstance(query, bytes):
+        query = query[:200].decode("utf-8", "replace")
+    words = query.split(None, 2)
+    if not words:
+        return "EMPTY"
+    keyword = words[0].upper()
+    if keyword in NAMED_STATEMENTS and len(words) > 1:
+        return f"{keyword} {words[1].split('(')[0]}"
+    return keyword
+
+
+class LogSink:
+    """
+    Writes one line per measurement to a text stream.
+    """
+
+    def __init__(self, stream=None):
+        """
+        Args:
+            stream: Text stream, sys.stderr by default
+        """
+        self.stream = stream or sys.stderr
+
+    def record_statement(self, label, seconds, rows, bytes_sent):
+        print(
+            f"query statement={label!r} ms={seconds * 1000:.3f} "
+            f"rows={rows} bytes_sent={bytes_sent}",
+            file=self.stream,
+        )
+
+    def record_pool_wait(self, seconds):
+        print(f"pool wait ms={seconds * 1000:.3f}", file=self.stream)
+
+
+class Histogram:
+    """
+    Cumulative-bucket latency histogram (Prometheus layout).
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last slot: above every bound
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def state(self):
+        return self.counts, self.count, self.sum
+
+    def add(self, state):
+        """
+        Add the state() of a histogram with the same buckets.
+        """
+        counts, count, total = state
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, counts)]
+        self.count += count
+        self.sum += total
+
+
+class HistogramSink:
+    """
+    Aggregates measurements in memory, per statement label.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        """
+        Args:
+            buckets (tuple): Histogram bucket upper bounds in seconds
+        """
+        self.buckets = buckets
+        self.reset()
+
+    def reset(self):
+        """
+        Drop every measurement, e.g. in a forked child that must not report
+        the parent's.
+        """
+        # A new lock too: the parent's may have been held at fork time
+        self.lock = threading.Lock()
+        self.statements = {}  # label -> Histogram of statement durations
+        self.rows = {}  # label -> total rows
+        self.bytes_sent = {}  # label -> total bytes sent
+        self.pool_wait = Histogram(self.buckets)
+
+    def record_statement(self, label, seconds, rows, bytes_sent):
+        with self.lock:
+            histogram = self.statements.get(label)
+            if histogram is None:
+                histogram = self.statements[label] = Histogram(self.buckets)
+            histogram.observe(seconds)
+            if rows > 0:
+                self.rows[label] = self.rows.get(label, 0) + rows
+            self.bytes_sent[label] = self.bytes_sent.get(label, 0) + bytes_sent
+
+    def record_pool_wait(self, seconds):
+        with self.lock:
+            self.pool_wait.observe(seconds)
+
+    def take(self):
+        """
+        Export the measurements as plain (picklable) data and reset them.
+
+        Returns:
+            dict: Histogram state per statement label, row and byte totals,
+                  and the pool wait histogram state
+        """
+        with self.lock:
+            taken = {
+                "statements": {
+                    label: histogram.state()
+                    for label, histogram in self.statements.items()
+                },
+                "rows": self.rows,
+                "bytes_sent": self.bytes_sent,
+                "pool_wait": self.pool_wait.state(),
+            }
+            self.statements = {}
+            self.rows = {}
+            self.bytes_sent = {}
+            self.pool_wait = Histogram(self.buckets)
+        return taken
+
+    def merge(self, taken):
+        """
+        Add measurements exported by take() in another process.
+
+        Args:
+            taken (dict): Result of take() on a sink with the same buckets
+        """
+        with self.lock:
+            for label, state in taken["statements"].items():
+                histogram = self.statements.get(label)
+                if histogram is None:
+                    histogram = self.statements[label] = Histogram(self.buckets)
+                histogram.add(state)
+            for totals, extra in (
+                (self.rows, taken["rows"]),
+                (self.bytes_sent, taken["bytes_sent"]),
+            ):
+                for label, total in extra.items():
+                    totals[label] = totals.get(label, 0) + total
+            self.pool_wait.add(taken["pool_wait"])
+
+    def snapshot(self):
+        """
+        Summarize the measurements collected so far.
+
+        Returns:
+            dict: Per label: count, total seconds, mean milliseconds, rows and
+                  bytes sent; plus the pool wait count and total seconds
+        """
+        with self.lock:
+            statements = {
+                label: {
+                    "count": histogram.count,
+                    "seconds": histogram.sum,
+                    "mean_ms": histogram.sum / histogram.count * 1000,
+                    "rows": self.rows.get(label, 0),
+                    "bytes_sent": self.bytes_sent.get(label, 0),
+                }
+                for label, histogram in self.statements.items()
+            }
+            return {
+                "statements": statements,
+                "pool_wait": {
+                    "count": self.pool_wait.count,
+                    "seconds": self.pool_wait.sum,
+                },
+            }
+
+
+class PrometheusTextfileSink(HistogramSink):
+    """
+    HistogramSink that periodically writes its metrics to a textfile for the
+    node_exporter textfile collector.
+    """
+
+    def __init__(self, path=QUERY_TRACE_TEXTFILE, flush_interval=QUERY_TRACE_FLUSH):
+        """
+        Args:
+            path (str): Output file
+            flush_interval (float): Minimum seconds between rewrites
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        # False in worker processes, which hand their metrics to the parent
+        self.writes_file = True
+        super().__init__()
+        atexit.register(self.flush)
+
+    def reset(self):
+        super().reset()
+        self.flushed_at = time.monotonic()
+
+    def record_statement(self, label, seconds, rows, bytes_sent):
+        super().record_statement(label, seconds, rows, bytes_sent)
+        if time.monotonic() - self.flushed_at >= self.flush_interval:
+            self.flush()
+
+    def render(self):
+        """
+        Format the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: Metric families for statement durations, rows, bytes sent
+                 and pool waits
+        """
+        lines = []
+
+        def histogram_lines(name, histogram, labels):
+            cumulative = 0
+            for bound, count in zip(self.buckets, histogram.counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels}le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{labels}le="+Inf"}} {histogram.count}')
+            series = f"{{{labels.rstrip(',')}}}" if labels else ""
+            lines.append(f"{name}_sum{series} {histogram.sum}")
+            lines.append(f"{name}_count{series} {histogram.count}")
+
+        with self.lock:
+            lines.append("# HELP psycopg2_statement_seconds Statement wall time.")
+            lines.append("# TYPE psycopg2_statement_seconds histogram")
+            for label, histogram in sorted(self.statements.items()):
+                labels = f'statement="{escape_label(label)}",'
+                histogram_lines("psycopg2_statement_seconds", histogram, labels)
+            for name, totals, help_text in (
+                (
+                    "psycopg2_statement_rows_total",
+                    self.rows,
+                    "Rows returned or affected.",
+                ),
+                ("psycopg2_statement_bytes_sent_total", self.bytes_sent, "Bytes sent."),
+            ):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                for label, total in sorted(totals.items()):
+                    lines.append(f'{name}{{statement="{escape_label(label)}"}} {total}')
+            lines.append(
+                "# HELP psycopg2_pool_wait_seconds Time waiting for a pooled connection."
+            )
+            lines.append("# TYPE psycopg2_pool_wait_seconds histogram")
+            histogram_lines("psycopg2_pool_wait_seconds", self.pool_wait, "")
+        return "\n".join(lines) + "\n"
+
+    def flush(self):
+        """
+        Rewrite the textfile atomically, so the collector never reads a
+        partially written file.
+        """
+        if not self.writes_file:
+            return
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as textfile:
+            textfile.write(self.render())
+        os.replace(temporary, self.path)
+        self.flushed_at = time.monotonic()
+
+
+def escape_label(value):
+    """
+    Escape a Prometheus label value.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Sink classes selectable through QUERY_TRACE
+SINKS = {
+    "log": LogSink,
+    "histogram": HistogramSink,
+    "prometheus": PrometheusTextfileSink,
+}
+
+
+class Tracer:
+    """
+    Fans measurements out to the configured sinks.
+    """
+
+    def __init__(self, sinks=()):
+        """
+        Args:
+            sinks (iterable): Sink objects with record_statement() and
+                              record_pool_wait() methods
+        """
+        self.sinks = list(sinks)
+
+    @classmethod
+    def from_env(cls, spec=QUERY_TRACE):
+        """
+        Build a tracer from a comma-separated list of sink names.
+
+        Args:
+            spec (str): e.g. "log,prometheus"; empty for no sinks
+
+        Returns:
+            Tracer: Tracer with one sink per known name
+
+        Raises:
+            ValueError: If a sink name is unknown
+        """
+        names = [name.strip() for name in spec.split(",") if name.strip()]
+        unknown = [name for name in names if name not in SINKS]
+        if unknown:
+            raise ValueError(
+                f"Unknown QUERY_TRACE sinks {unknown}, expected {list(SINKS)}"
+            )
+        return cls(SINKS[name]() for name in names)
+
+    @property
+    def enabled(self):
+        return bool(self.sinks)
+
+    def record_statement(self, label, seconds, rows, bytes_sent):
+        for sink in self.sinks:
+            sink.record_statement(label, seconds, rows, bytes_sent)
+
+    def record_pool_wait(self, seconds):
+        for sink in self.sinks:
+            sink.record_pool_wait(seconds)
+
+    def snapshot(self):
+        """
+        Return the summary of the first in-memory sink.
+
+        Returns:
+            dict or None: HistogramSink.snapshot(), or None without such a sink
+        """
+        for sink in self.sinks:
+            if isinstance(sink, HistogramSink):
+                return sink.snapshot()
+        return None
+
+
+# Process-wide tracer configured from the environment
+tracer = Tracer.from_env()
+
+
+def _reset_after_fork():
+    """
+    Clear the in-memory sinks in a forked child process.
+    """
+    for sink in tracer.sinks:
+        if hasattr(sink, "reset"):
+            sink.reset()
+
+
+if hasattr(os, "register_at_fork"):  # Not available on Windows
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+# COPY statements that send a file's contents to the server
+COPY_FROM_STDIN = re.compile(rb"\bFROM\s+STDIN\b", re.IGNORECASE)
+
+
+def copies_from_stdin(sql):
+    """
+    Tell whether a copy_expert() statement reads its file (COPY ... FROM STDIN).
+
+    Args:
+        sql (str or bytes): COPY statement; composed SQL objects are not
+                            inspected and count as not reading
+
+    Returns:
+        bool: True for COPY ... FROM STDIN
+    """
+    if isinstance(sql, str):
+        sql = sql.encode("utf-8")
+    return isinstance(sql, bytes) and COPY_FROM_STDIN.search(sql) is not None
+
+
+class _CountingReader:
+    """
+    Wraps the file given to copy_expert() to count the bytes sent.
+
+    Text files are counted in bytes of the connection encoding, which is what
+    psycopg2 sends, rather than in characters.
+    """
+
+    def __init__(self, file, encoding):
+        """
+        Args:
+            file: File object read by copy_expert()
+            encoding (str): Python codec of the connection's client encoding
+        """
+        self.file = file
+        self.encoding = encoding
+        self.bytes_read = 0
+
+    def count(self, data):
+        if isinstance(data, str):
+            self.bytes_read += len(data.encode(self.encoding))
+        else:
+            self.bytes_read += len(data)
+        return data
+
+    def read(self, size=-1):
+        return self.count(self.file.read(size))
+
+    def readline(self, size=-1):
+        return self.count(self.file.readline(size))
+
+
+class TracingCursor(extensions.cursor):
+    """
+    Cursor that reports every execute(), executemany() and copy_expert().
+
+    Helpers built on execute(), such as execute_values() and execute_batch(),
+    are measured once per page they send.
+    """
+
+    def record(self, query, started, bytes_sent):
+        tracer.record_statement(
+            statement_label(query),
+            time.perf_counter() - started,
+            max(self.rowcount, 0),
+            bytes_sent,
+        )
+
+    def execute(self, query, vars=None):
+        started = time.perf_counter()
+        try:
+            return super().execute(query, vars)
+        finally:
+            # self.query holds the statement as sent, parameters included
+            self.record(query, started, len(self.query or b""))
+
+    def executemany(self, query, vars_list):
+        started = time.perf_counter()
+        try:
+            return super().executemany(query, vars_list)
+        finally:
+            # Only the last statement is kept in self.query, so the bytes
+            # sent are not known exactly here
+            self.record(query, started, 0)
+
+    def copy_expert(self, sql, file, size=8192):
+        started = time.perf_counter()
+        # Only COPY ... FROM STDIN reads the file; COPY ... TO STDOUT writes
+        # to it, so the file is passed through unchanged
+        if copies_from_stdin(sql) and hasattr(file, "read"):
+            encoding = extensions.encodings.get(self.connection.encoding, "utf-8")
+            reader = _CountingReader(file, encoding)
+        else:
+            reader = file
+        try:
+            return super().copy_expert(sql, reader, size)
+        finally:
+            bytes_sent = len(sql) + getattr(reader, "bytes_read", 0)
+            self.record(sql, started, bytes_sent)
+
+
+class TracingConnection(extensions.connection):
+    """
+    Connection whose cursors are TracingCursors by default.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cursor_factory = TracingCursor
+
+
+def connection_factory():
+    """
+    Connection class to pass to psycopg2.connect(connection_factory=...).
+
+    Returns:
+        type or None: TracingConnection if tracing is enabled, otherwise None
+                      (psycopg2's default connection class)
+    """
+    return TracingConnection if tracer.enabled else None
+
+
+def flush():
+    """
+    Write out the metrics of sinks that buffer them (the Prometheus textfile).
+
+    Sinks also flush themselves periodically and at exit.
+    """
+    for sink in tracer.sinks:
+        if hasattr(sink, "flush"):
+            sink.flush()
+
+
+def report_to_parent():
+    """
+    Process pool initializer: let the parent process report this worker.
+
+    The worker stops writing the Prometheus textfile, so workers and parent
+    never write the same series to separate files or replace each other's
+    file. Tasks return take_metrics() and the parent calls merge_metrics().
+    """
+    for sink in tracer.sinks:
+        if isinstance(sink, PrometheusTextfileSink):
+            sink.writes_file = False
+
+
+def take_metrics():
+    """
+    Export and reset the in-memory measurements of this process.
+
+    Returns:
+        list or None: One take() result per in-memory sink, or None when
+                      tracing is disabled
+    """
+    if not tracer.enabled:
+        return None
+    return [sink.take() for sink in tracer.sinks if isinstance(sink, HistogramSink)]
+
+
+def merge_metrics(metrics):
+    """
+    Add the measurements a worker returned from take_metrics().
+
+    Workers use the same QUERY_TRACE as their parent, so their sinks line up
+    with the parent's.
+
+    Args:
+        metrics (list or None): Result of take_metrics() in the worker
+    """
+    if not metrics:
+        return
+    sinks = [sink for sink in tracer.sinks if isinstance(sink, HistogramSink)]
+    for sink, taken in zip(sinks, metrics):
+        sink.merge(taken)
+
+
+def record_pool_wait(seconds):
+    """
+    Report the time spent waiting for a pooled connection.
+
+    Args:
+        seconds (float): Wait duration
+    """
+    if tracer.enabled:
+        tracer.record_pool_wait(seconds)